@@ -0,0 +1,202 @@
+"""
+CHSH numbers for the deck, computed instead of typed in.
+
+A behaviour p(ab|xy) is a (2, 2, 2, 2) array indexed [a, b, x, y]; a batch
+of N behaviours is (N, 2, 2, 2, 2). Every function takes either and works
+on the whole batch at once (no Python loop over boxes), so scoring a few
+million boxes is one matrix product.
+
+  S = E00 + E01 + E10 − E11,   E_xy = Σ_ab (−1)^(a⊕b) p(ab|xy)
+
+CLASSICAL_BOUND, TSIRELSON_BOUND and NO_SIGNALLING_BOUND are the maxima
+over the local deterministic boxes, the optimal measurements on a
+maximally entangled pair, and the PR box. The scenes import them.
+Scenario describes other input/output counts in the same [a, b, x, y]
+layout for bell_local and bell_npa.
+
+Run:
+  python bell_chsh.py                  # the three bounds
+  python bell_chsh.py --boxes 5000000  # timing on random no-signalling boxes
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """Bipartite Bell scenario: inputs and outputs per party."""
+    inputs_a: int = 2
+    outputs_a: int = 2
+    inputs_b: int = 2
+    outputs_b: int = 2
+
+    @property
+    def shape(self):
+        """Layout of p(ab|xy) and of Bell coefficients: [a, b, x, y]."""
+        return (self.outputs_a, self.outputs_b, self.inputs_a, self.inputs_b)
+
+
+CHSH = Scenario()
+I3322 = Scenario(3, 2, 3, 2)
+SHAPE = CHSH.shape
+
+# CHSH as a Bell functional W[a, b, x, y]: S = Σ W · p
+CHSH_SIGNS = np.array([[1.0, 1.0], [1.0, -1.0]])   # c_xy in S = Σ c_xy E_xy
+_PARITY = np.array([1.0, -1.0])
+CHSH_FUNCTIONAL = np.einsum("a,b,xy->abxy", _PARITY, _PARITY, CHSH_SIGNS)
+
+# No-signalling as 8 linear forms on p: p(a|x, y=0) − p(a|x, y=1) for each a, x,
+# and p(b|x=0, y) − p(b|x=1, y) for each b, y. All vanish on a no-signalling box.
+_EYE, _DIFF = np.eye(2), np.array([1.0, -1.0])
+NS_CONSTRAINTS = np.concatenate([
+    np.einsum("ia,b,jx,y->ijabxy", _EYE, np.ones(2), _EYE, _DIFF).reshape(4, -1),
+    np.einsum("a,ib,x,jy->ijabxy", np.ones(2), _EYE, _DIFF, _EYE).reshape(4, -1),
+])
+
+
+def as_batch(p):
+    """p as a float (N, 2, 2, 2, 2) array; a single box becomes N = 1."""
+    p = np.asarray(p, dtype=float)
+    if p.shape == SHAPE:
+        p = p[None]
+    if p.ndim != 5 or p.shape[1:] != SHAPE:
+        raise ValueError(f"expected a (N, 2, 2, 2, 2) behaviour array, got {p.shape}")
+    return p
+
+
+# ─────────────────────────────────────────────────────────
+# Behaviours
+# ─────────────────────────────────────────────────────────
+def deterministic_boxes():
+    """The 16 local deterministic boxes a = f(x), b = g(y)."""
+    outputs = np.arange(2)
+    functions = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])          # f[k, x]
+    table = (outputs[None, :, None] == functions[:, None, :]).astype(float)  # [k, a, x]
+    return np.einsum("iax,jby->ijabxy", table, table).reshape(16, *SHAPE)
+
+
+def pr_box(alpha=0, beta=0, gamma=0):
+    """PR box with a ⊕ b = xy ⊕ αx ⊕ βy ⊕ γ (the default is the deck's a ⊕ b = xy)."""
+    a, b, x, y = np.indices(SHAPE)
+    return 0.5 * ((a ^ b) == ((x & y) ^ (alpha * x) ^ (beta * y) ^ gamma))
+
+
+def pr_boxes():
+    """All eight PR boxes, the non-local vertices of the no-signalling polytope."""
+    return np.stack([pr_box(al, be, ga) for al in (0, 1) for be in (0, 1) for ga in (0, 1)])
+
+
+def quantum_box(alice_angles, bob_angles):
+    """
+    Boxes from measuring |Φ+⟩ along angles in the X–Z plane:
+    p(ab|xy) = (1 + (−1)^(a⊕b) cos(θ_x − φ_y)) / 4. Angle arrays are (..., 2).
+    """
+    theta = np.asarray(alice_angles, dtype=float)
+    phi = np.asarray(bob_angles, dtype=float)
+    corr = np.cos(theta[..., :, None] - phi[..., None, :])          # [..., x, y]
+    sign = np.array([[1.0, -1.0], [-1.0, 1.0]])                      # (−1)^(a⊕b)
+    return (1 + sign[:, :, None, None] * corr[..., None, None, :, :]) / 4
+
+
+def tsirelson_box():
+    """The optimal CHSH measurements: θ = 0, π/2 and φ = π/4, −π/4."""
+    return quantum_box([0.0, np.pi / 2], [np.pi / 4, -np.pi / 4])
+
+
+def with_visibility(p, v):
+    """v·p + (1 − v)·white noise, batched over an array of visibilities v."""
+    v = np.asarray(v, dtype=float)[..., None, None, None, None]
+    return v * np.asarray(p, dtype=float) + (1 - v) / 4
+
+
+def random_ns_boxes(n, rng=None):
+    """n random no-signalling boxes: Dirichlet mixtures of the 24 polytope vertices."""
+    rng = np.random.default_rng(rng)
+    vertices = np.concatenate([deterministic_boxes(), pr_boxes()]).reshape(24, -1)
+    weights = rng.dirichlet(np.full(len(vertices), 0.2), size=n)   # sparse: near the vertices
+    return (weights @ vertices).reshape(n, *SHAPE)
+
+
+# ─────────────────────────────────────────────────────────
+# Quantities
+# ─────────────────────────────────────────────────────────
+def correlators(p):
+    """E_xy = Σ_ab (−1)^(a⊕b) p(ab|xy), shape (N, 2, 2)."""
+    p = as_batch(p)
+    return p[:, 0, 0] + p[:, 1, 1] - p[:, 0, 1] - p[:, 1, 0]
+
+
+def chsh_terms(p):
+    """The four signed terms c_xy E_xy in the order xy = 00, 01, 10, 11, shape (N, 4)."""
+    return (correlators(p) * CHSH_SIGNS).reshape(-1, 4)
+
+
+def chsh(p):
+    """S for every box, shape (N,)."""
+    p = as_batch(p)
+    return p.reshape(len(p), -1) @ CHSH_FUNCTIONAL.ravel()
+
+
+def winning_probability(p):
+    """Probability of winning the CHSH game a ⊕ b = xy with uniform inputs."""
+    return 0.5 + chsh(p) / 8
+
+
+def marginals(p):
+    """(Alice's p(a|xy), Bob's p(b|xy)), each (N, 2, 2, 2) indexed [out, x, y]."""
+    p = as_batch(p)
+    return p.sum(axis=2), p.sum(axis=1)
+
+
+def no_signalling_residual(p):
+    """
+    Largest change of one party's marginal under the other party's input
+    choice, per box; 0 for a no-signalling box.
+    """
+    p = as_batch(p)
+    return np.abs(p.reshape(len(p), -1) @ NS_CONSTRAINTS.T).max(axis=1)
+
+
+def normalisation_residual(p):
+    """Largest |Σ_ab p(ab|xy) − 1| per box, together with any negative entry."""
+    p = as_batch(p)
+    total = np.abs(p.sum(axis=(1, 2)) - 1).reshape(len(p), -1).max(axis=1)
+    negative = np.maximum(-p.reshape(len(p), -1).min(axis=1), 0)
+    return np.maximum(total, negative)
+
+
+def is_no_signalling(p, tol=1e-9):
+    return (no_signalling_residual(p) <= tol) & (normalisation_residual(p) <= tol)
+
+
+CLASSICAL_BOUND = float(chsh(deterministic_boxes()).max())      # 2
+TSIRELSON_BOUND = float(chsh(tsirelson_box())[0])               # 2√2
+NO_SIGNALLING_BOUND = float(chsh(pr_box())[0])                  # 4
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CHSH bounds and batch timing.")
+    parser.add_argument("--boxes", type=int, default=0, help="score this many random boxes")
+    args = parser.parse_args(argv)
+
+    print(f"classical      S ≤ {CLASSICAL_BOUND:.6f}")
+    print(f"Tsirelson      S ≤ {TSIRELSON_BOUND:.6f}")
+    print(f"no-signalling  S ≤ {NO_SIGNALLING_BOUND:.6f}")
+    if args.boxes:
+        boxes = random_ns_boxes(args.boxes, rng=0)
+        start = time.perf_counter()
+        s = chsh(boxes)
+        residual = no_signalling_residual(boxes)
+        seconds = time.perf_counter() - start
+        print(f"{args.boxes} boxes in {seconds * 1e3:.0f} ms: S ∈ [{s.min():.3f}, {s.max():.3f}], "
+              f"{(s > CLASSICAL_BOUND).mean():.1%} non-local, max NS residual {residual.max():.1e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
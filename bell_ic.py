@@ -0,0 +1,108 @@
+"""
+Information Causality for the nested van Dam / Pawłowski protocol.
+
+Alice holds N = 2^n random bits and sends Bob one bit; they share noisy
+PR boxes that satisfy a ⊕ b = xy with probability (1 + E)/2. In the
+nested protocol Bob's guess of the bit he wants passes through n boxes,
+one per level, and each level multiplies its bias by E:
+
+  e_0 = 1,  e_{k+1} = E · e_k      ⇒  P(β = a_b) = (1 + E^n) / 2
+
+so every term of I = Σ_i I(a_i : β | b = i) is one binary symmetric
+channel and I = 2^n · (1 − h((1 + E^n)/2)), with no 2^n-bit strings
+simulated. IC (I ≤ 1) fails at large n iff 2E² > 1, i.e. E > 1/√2; for
+isotropic boxes E = S/4, so the threshold is Tsirelson's S = 2√2.
+
+Everything broadcasts over arrays of E and n and is evaluated in log₂
+(the series of 1 − h near e = 0), so depths in the thousands neither
+underflow nor overflow.
+
+Run:
+  python bell_ic.py                      # I at the deck's depth, threshold vs. depth
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+IC_THRESHOLD = 2 ** -0.5        # E above which the nested protocol violates IC as n → ∞
+DECK_DEPTH = 10                 # N = 1024 bits in ICGame / TsirelsonGauge
+_SERIES_BELOW = 1e-2            # |e| where 1 − h switches to its power series
+
+
+def bias(p):
+    """E of a CHSH behaviour: 2·P(a ⊕ b = xy) − 1 = S/4 (exact for isotropic boxes)."""
+    import bell_chsh
+
+    return 2 * bell_chsh.winning_probability(p) - 1
+
+
+def log2_channel_gain(log2_e):
+    """
+    log₂(1 − h((1 + e)/2)) for e = 2^log2_e ≥ 0: what Bob learns about one
+    bit from a guess with bias e. Stable for e → 0 and e → 1.
+    """
+    log2_e = np.asarray(log2_e, dtype=float)
+    e = np.exp2(np.minimum(log2_e, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # direct: ((1 + e) log(1 + e) + (1 − e) log(1 − e)) / (2 ln 2)
+        direct = np.log2(((1 + e) * np.log1p(e) + np.where(e < 1, (1 - e) * np.log1p(-e), 0))
+                         / (2 * np.log(2)))
+        # series: Σ_k e^{2k} / (k (2k − 1)) / (2 ln 2), factoring out e²
+        e2 = e * e
+        rest = 1 + e2 / 6 + e2 ** 2 / 15 + e2 ** 3 / 28 + e2 ** 4 / 45
+        series = 2 * log2_e - np.log2(2 * np.log(2)) + np.log2(rest)
+    return np.where(e < _SERIES_BELOW, series, direct)
+
+
+def log2_information(E, n):
+    """log₂ I for boxes of bias E at depth n (N = 2^n bits); broadcasts."""
+    E, n = np.broadcast_arrays(np.asarray(E, dtype=float), np.asarray(n, dtype=float))
+    with np.errstate(divide="ignore"):
+        log2_e = n * np.log2(np.abs(E))          # per-level recursion e_n = E^n, in log₂
+    return n + log2_channel_gain(log2_e)
+
+
+def information(E, n):
+    """I = Σ_i I(a_i : β | b = i) for bias E at depth n (inf if it overflows)."""
+    with np.errstate(over="ignore"):
+        return np.exp2(log2_information(E, n))
+
+
+def violates(E, n, m=1):
+    return log2_information(E, n) > np.log2(m)
+
+
+def threshold(n, steps=60):
+    """Smallest bias E with I > 1 at depth n (bisection, vectorised over n)."""
+    n = np.asarray(n, dtype=float)
+    lo, hi = np.zeros(n.shape), np.ones(n.shape)
+    for _ in range(steps):
+        mid = (lo + hi) / 2
+        over = violates(mid, n)
+        lo, hi = np.where(over, lo, mid), np.where(over, mid, hi)
+    return hi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Information Causality of noisy PR boxes.")
+    parser.add_argument("--depth", type=int, default=DECK_DEPTH, help="n, with N = 2^n bits")
+    args = parser.parse_args(argv)
+
+    import bell_chsh
+
+    boxes = {"classical": bell_chsh.CLASSICAL_BOUND / 4, "Tsirelson": bell_chsh.TSIRELSON_BOUND / 4,
+             "PR box": bias(bell_chsh.pr_box())[0]}
+    print(f"depth n = {args.depth} (N = {2 ** args.depth} bits, m = 1)")
+    for name, E in boxes.items():
+        print(f"  {name:<10} E = {E:.4f}  I = {information(E, args.depth):.6g}")
+    depths = np.array([1, 2, 4, 8, 16, 64, 256, 1024, 4096])
+    for n, E in zip(depths, threshold(depths)):
+        print(f"  n = {n:<5} IC fails above E = {E:.6f}  (S = {4 * E:.6f})")
+    print(f"  n → ∞    E → 1/√2 = {IC_THRESHOLD:.6f}  (S = {4 * IC_THRESHOLD:.6f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+The local polytope L: deterministic strategies, local bounds, membership.
+
+A deterministic strategy of one party is an integer code whose base-k
+digits are its outputs for inputs 0, 1, … (plain bits for two outcomes),
+so the strategies of a party are just range(k**m) and the vertices of L
+are pairs of codes; tables and vertex arrays are unpacked from the codes
+with numpy, never built one Python object per vertex.
+
+  local_bound        max of a Bell expression over L. For a fixed Alice
+                     strategy Bob's best reply is chosen input by input,
+                     so this costs k_A^m_A · k_B · m_B, not |vertices|.
+  local_visibility   LP (scipy/HiGHS): the largest v ≤ 1 with
+                     v·p + (1 − v)·noise ∈ L; p ∈ L iff v = 1. A batch is
+                     solved as one block-diagonal LP per chunk.
+  correlator_section L cut by a plane of CHSH correlators, for the deck.
+
+Bell expressions and behaviours use bell_chsh's layout [a, b, x, y].
+
+Run:
+  python bell_local.py                  # local bounds of CHSH, I3322, CGLMP
+  python bell_local.py --members 2000   # LP membership vs. the CHSH facets
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from bell_chsh import CHSH, I3322, Scenario
+
+CHUNK = 256          # behaviours per block-diagonal LP
+
+
+def cglmp_scenario(d):
+    return Scenario(2, d, 2, d)
+
+
+def cglmp(d):
+    """The CGLMP expression I_d (Collins et al. 2002); local bound 2."""
+    g = np.zeros(cglmp_scenario(d).shape)
+    a, b = np.indices((d, d))
+    for k in range(d // 2):
+        weight = 1 - 2 * k / (d - 1)
+        # (x, y, which difference, shift): + P(A_x − B_y ≡ shift) or + P(B_y − A_x ≡ shift)
+        for x, y, diff, plus, minus in ((0, 0, a - b, k, -k - 1),
+                                        (1, 0, b - a, k + 1, -k),
+                                        (1, 1, a - b, k, -k - 1),
+                                        (0, 1, b - a, k, -k - 1)):
+            g[..., x, y] += weight * ((diff - plus) % d == 0)
+            g[..., x, y] -= weight * ((diff - minus) % d == 0)
+    return g
+
+
+# ─────────────────────────────────────────────────────────
+# Strategies and vertices
+# ─────────────────────────────────────────────────────────
+def strategies(inputs, outputs):
+    """Output table of every deterministic strategy, (outputs**inputs, inputs) uint8."""
+    codes = np.arange(outputs ** inputs)
+    return (codes[:, None] // outputs ** np.arange(inputs) % outputs).astype(np.uint8)
+
+
+def _one_hot(table, outputs):
+    """[strategy, output, input] indicator of a strategy table."""
+    return table[:, None, :] == np.arange(outputs)[None, :, None]
+
+
+def vertices(scenario=CHSH):
+    """The deterministic behaviours, (k_A^m_A · k_B^m_B, *scenario.shape) uint8."""
+    alice = _one_hot(strategies(scenario.inputs_a, scenario.outputs_a), scenario.outputs_a)
+    bob = _one_hot(strategies(scenario.inputs_b, scenario.outputs_b), scenario.outputs_b)
+    return (alice[:, None, :, None, :, None] & bob[None, :, None, :, None, :]).reshape(
+        -1, *scenario.shape).astype(np.uint8)
+
+
+# ─────────────────────────────────────────────────────────
+# Local bound
+# ─────────────────────────────────────────────────────────
+def local_bound(bell, scenario=CHSH):
+    """Maximum of each Bell expression G[a, b, x, y] over L, shape (N,)."""
+    bell = np.asarray(bell, dtype=float).reshape(-1, *scenario.shape)
+    if scenario.outputs_b ** scenario.inputs_b < scenario.outputs_a ** scenario.inputs_a:
+        # enumerate the party with fewer strategies
+        bell = bell.transpose(0, 2, 1, 4, 3)
+        scenario = Scenario(scenario.inputs_b, scenario.outputs_b,
+                            scenario.inputs_a, scenario.outputs_a)
+    alice = strategies(scenario.inputs_a, scenario.outputs_a)       # (S, m_A)
+    inputs = np.arange(scenario.inputs_a)
+    out = np.empty(len(bell))
+    for start in range(0, len(bell), CHUNK):
+        chunk = bell[start:start + CHUNK]
+        # G[n, alice[s, x], b, x, y] summed over x → [s, n, b, y]
+        value = chunk[:, alice, :, inputs, :].sum(axis=1)
+        # Bob answers each input with his best output
+        out[start:start + CHUNK] = value.max(axis=2).sum(axis=2).max(axis=0)
+    return out
+
+
+# ─────────────────────────────────────────────────────────
+# Membership (LP)
+# ─────────────────────────────────────────────────────────
+def _scipy():
+    try:
+        from scipy import optimize, sparse
+    except ImportError:
+        raise SystemExit("scipy is needed for local membership tests (pip install scipy)")
+    return optimize, sparse
+
+
+def local_visibility(p, scenario=CHSH):
+    """
+    Largest v ≤ 1 such that v·p + (1 − v)·(uniform noise) is a mixture of
+    deterministic behaviours, per behaviour; v = 1 means p ∈ L.
+    """
+    optimize, sparse = _scipy()
+    dim = int(np.prod(scenario.shape))
+    p = np.asarray(p, dtype=float).reshape(-1, dim)
+    hull = sparse.csr_matrix(vertices(scenario).reshape(-1, dim).T.astype(float))   # (dim, V)
+    n_vertices = hull.shape[1]
+    noise = np.full(dim, 1.0 / (scenario.outputs_a * scenario.outputs_b))
+    out = np.empty(len(p))
+    for start in range(0, len(p), CHUNK):
+        chunk = p[start:start + CHUNK]
+        n = len(chunk)
+        # one block per behaviour: hull·λ_i − v_i·(p_i − noise) = noise
+        shift = sparse.block_diag([-(q - noise)[:, None] for q in chunk], format="csr")
+        a_eq = sparse.hstack([sparse.kron(sparse.identity(n), hull), shift], format="csr")
+        cost = np.concatenate([np.zeros(n * n_vertices), -np.ones(n)])
+        bounds = [(0, None)] * (n * n_vertices) + [(0, 1)] * n
+        res = optimize.linprog(cost, A_eq=a_eq, b_eq=np.tile(noise, n), bounds=bounds,
+                               method="highs")
+        if res.status != 0:
+            raise RuntimeError(f"local membership LP failed: {res.message}")
+        out[start:start + n] = res.x[-n:]
+    return out
+
+
+def is_local(p, scenario=CHSH, tol=1e-9):
+    return local_visibility(p, scenario) >= 1 - tol
+
+
+# ─────────────────────────────────────────────────────────
+# Planar sections for the deck
+# ─────────────────────────────────────────────────────────
+def correlator_vertices():
+    """Correlators E_xy = a_x b_y of the 16 deterministic CHSH strategies, (16, 2, 2)."""
+    signs = 1 - 2 * strategies(2, 2).astype(float)                    # ±1 outputs per input
+    return np.einsum("ix,jy->ijxy", signs, signs).reshape(16, 2, 2)
+
+
+def convex_hull(points):
+    """Vertices of the 2D convex hull, counter-clockwise (monotone chain)."""
+    points = np.unique(np.round(np.asarray(points, dtype=float), 12), axis=0)
+    if len(points) < 3:
+        return points
+
+    def turn(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def half(pts):
+        chain = []
+        for pt in pts:
+            while len(chain) >= 2 and turn(chain[-2], chain[-1], pt) <= 0:
+                chain.pop()
+            chain.append(pt)
+        return chain[:-1]
+
+    return np.array(half(points) + half(points[::-1]))
+
+
+def correlator_section(basis):
+    """
+    L ∩ {E = x·basis[0] + y·basis[1]} for unbiased CHSH boxes, as (x, y)
+    polygon vertices. Computed as the projection of the deterministic
+    correlators, which equals the section when the plane is the fixed
+    space of a relabelling symmetry of L: the deck's plane E00 = −E11,
+    E01 = E10 is fixed by swapping both parties' inputs and flipping
+    Alice's output on input 0 and Bob's on input 1.
+    """
+    basis = np.asarray(basis, dtype=float).reshape(2, 4)
+    coords = correlator_vertices().reshape(16, 4) @ np.linalg.pinv(basis)
+    return convex_hull(coords) + 0.0          # no −0.0 in the output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local bounds and local-polytope membership.")
+    parser.add_argument("--members", type=int, default=0,
+                        help="test this many random no-signalling CHSH boxes by LP")
+    args = parser.parse_args(argv)
+
+    import bell_chsh
+    from bell_npa import i3322
+
+    cases = [("CHSH", CHSH, bell_chsh.CHSH_FUNCTIONAL), ("I3322", I3322, i3322())]
+    cases += [(f"CGLMP{d}", cglmp_scenario(d), cglmp(d)) for d in range(3, 7)]
+    for name, scenario, bell in cases:
+        start = time.perf_counter()
+        bound = local_bound(bell, scenario)[0]
+        print(f"{name:<7} {len(vertices(scenario)):>5} vertices  local bound {bound:.6f}  "
+              f"({(time.perf_counter() - start) * 1e3:.1f} ms)")
+    if args.members:
+        boxes = bell_chsh.random_ns_boxes(args.members, rng=0)
+        start = time.perf_counter()
+        local = is_local(boxes)
+        seconds = time.perf_counter() - start
+        # Fine: an NS box in this scenario is local iff all eight CHSH variants are ≤ 2
+        corr = bell_chsh.correlators(boxes).reshape(-1, 4)
+        patterns = np.array([[1, 1, 1, -1], [1, 1, -1, 1], [1, -1, 1, 1], [-1, 1, 1, 1]])
+        facets = np.abs(corr @ patterns.T).max(axis=1) <= bell_chsh.CLASSICAL_BOUND + 1e-9
+        print(f"{args.members} boxes by LP in {seconds:.2f}s: {local.mean():.1%} local, "
+              f"agrees with the CHSH facets on {(local == facets).mean():.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
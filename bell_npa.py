@@ -0,0 +1,303 @@
+"""
+Quantum bounds of Bell expressions from the NPA hierarchy.
+
+The quantum maximum of a Bell expression is bounded from above by a
+semidefinite program over moment matrices Γ[i, j] = ⟨S_i† S_j⟩ of
+products of measurement projectors (Navascués, Pironio, Acín). Levels:
+
+  1      S ∈ {1, A, B}
+  1+AB   S ∈ {1, A, B, AB}
+  2      S ∈ {1, A, B, AA', BB', AB}
+
+Projectors are in Collins–Gisin form (the last outcome of each measurement
+is dropped). The moment matrix pattern is built once per scenario and
+level (moment_structure) and set up in the SDP solver once (npa_solver);
+solving for another expression only replaces the objective. The backend
+is Clarabel or SCS (warm-started), both open source and CPU-only.
+
+Bell expressions use bell_chsh's layout: coefficients G[a, b, x, y] with
+value Σ G · p, e.g. bell_chsh.CHSH_FUNCTIONAL. Needs scipy and clarabel
+(or scs); the scenes never import this module.
+
+Run:
+  python bell_npa.py                   # CHSH and I3322 at every level
+  python bell_npa.py --random 500      # batch timing on random correlator expressions
+"""
+
+import argparse
+import functools
+import importlib
+import sys
+import time
+from dataclasses import dataclass
+from itertools import product
+
+import numpy as np
+
+from bell_chsh import CHSH, I3322, Scenario
+
+LEVELS = ("1", "1+AB", "2")
+
+
+def correlator_expression(coeffs):
+    """Two-outcome expression Σ c_xy E_xy as coefficients G[a, b, x, y]."""
+    coeffs = np.asarray(coeffs, dtype=float)
+    parity = np.array([[1.0, -1.0], [-1.0, 1.0]])
+    return parity[:, :, None, None] * coeffs[..., None, None, :, :]
+
+
+def i3322():
+    """
+    The I3322 inequality (Collins–Gisin 2004), I ≤ 0 for local boxes:
+    −2 pA(0|0) − pA(0|1) − pB(0|0) + Σ t_xy p(00|xy).
+    """
+    g = np.zeros(I3322.shape)
+    g[0, 0] = [[1, 1, 1], [1, 1, -1], [1, -1, 0]]
+    g[0, :, 0, 0] -= 2          # marginals read off at the other party's input 0
+    g[0, :, 1, 0] -= 1
+    g[:, 0, 0, 0] -= 1
+    return g
+
+
+# ─────────────────────────────────────────────────────────
+# Moment matrix structure (pure numpy, built once per level)
+# ─────────────────────────────────────────────────────────
+def _reduce(word):
+    """Simplify a product of one party's projectors; None if it is zero."""
+    out = []
+    for letter in word:
+        if out and out[-1][0] == letter[0]:
+            if out[-1][1] != letter[1]:
+                return None           # orthogonal outcomes of one measurement
+            continue                  # P² = P
+        out.append(letter)
+    return tuple(out)
+
+
+def _canonical(alice, bob):
+    """A moment and its adjoint are equal in the real relaxation."""
+    return min((alice, bob), (alice[::-1], bob[::-1]))
+
+
+def operators(scenario, level):
+    """The operator list S of one level, as (Alice word, Bob word) pairs."""
+    if level not in LEVELS:
+        raise ValueError(f"level must be one of {LEVELS}, got {level!r}")
+    a_ops = [((x, a),) for x in range(scenario.inputs_a) for a in range(scenario.outputs_a - 1)]
+    b_ops = [((y, b),) for y in range(scenario.inputs_b) for b in range(scenario.outputs_b - 1)]
+    ops = [((), ())] + [(w, ()) for w in a_ops] + [((), w) for w in b_ops]
+    if level in ("1+AB", "2"):
+        ops += [(wa, wb) for wa in a_ops for wb in b_ops]
+    if level == "2":
+        for party, single in ((0, a_ops), (1, b_ops)):
+            for w1, w2 in product(single, single):
+                word = _reduce(w1 + w2)
+                if word is not None and len(word) == 2:
+                    ops.append((word, ()) if party == 0 else ((), word))
+    return list(dict.fromkeys(ops))
+
+
+@dataclass(frozen=True)
+class MomentStructure:
+    scenario: Scenario
+    level: str
+    index: np.ndarray       # (n, n) moment id of Γ[i, j]; −1 where the product vanishes
+    moments: tuple          # canonical (Alice word, Bob word) per id; id 0 is ⟨1⟩
+    objective: np.ndarray   # (len(moments), prod(shape)): Bell coefficients → moment weights
+
+
+def _objective_map(scenario, ids):
+    """Express every full probability p(ab|xy) through the Collins–Gisin moments."""
+    last_a, last_b = scenario.outputs_a - 1, scenario.outputs_b - 1
+
+    def moment(alice, bob):
+        return ids[_canonical(alice, bob)]
+
+    def pa(a, x):
+        return {moment(((x, a),), ()): 1.0}
+
+    def pb(b, y):
+        return {moment((), ((y, b),)): 1.0}
+
+    def pab(a, b, x, y):
+        return {moment(((x, a),), ((y, b),)): 1.0}
+
+    def combine(*terms):
+        out = {}
+        for sign, term in terms:
+            for k, v in term.items():
+                out[k] = out.get(k, 0.0) + sign * v
+        return out
+
+    objective = np.zeros((len(ids), int(np.prod(scenario.shape))))
+    for flat, (a, b, x, y) in enumerate(np.ndindex(scenario.shape)):
+        if a < last_a and b < last_b:
+            row = pab(a, b, x, y)
+        elif a < last_a:
+            row = combine((1, pa(a, x)), *((-1, pab(a, bb, x, y)) for bb in range(last_b)))
+        elif b < last_b:
+            row = combine((1, pb(b, y)), *((-1, pab(aa, b, x, y)) for aa in range(last_a)))
+        else:
+            row = combine((1, {0: 1.0}),
+                          *((-1, pa(aa, x)) for aa in range(last_a)),
+                          *((-1, pb(bb, y)) for bb in range(last_b)),
+                          *((1, pab(aa, bb, x, y)) for aa in range(last_a) for bb in range(last_b)))
+        for k, v in row.items():
+            objective[k, flat] += v
+    return objective
+
+
+@functools.lru_cache(maxsize=None)
+def moment_structure(scenario, level):
+    ops = operators(scenario, level)
+    n = len(ops)
+    ids = {((), ()): 0}
+    index = np.full((n, n), -1, dtype=np.int64)
+    for i, (ai, bi) in enumerate(ops):
+        for j, (aj, bj) in enumerate(ops):
+            alice, bob = _reduce(ai[::-1] + aj), _reduce(bi[::-1] + bj)
+            if alice is None or bob is None:
+                continue
+            index[i, j] = ids.setdefault(_canonical(alice, bob), len(ids))
+    objective = _objective_map(scenario, ids)
+    return MomentStructure(scenario, level, index, tuple(ids), objective)
+
+
+# ─────────────────────────────────────────────────────────
+# SDP (Clarabel or SCS)
+# ─────────────────────────────────────────────────────────
+BACKENDS = ("clarabel", "scs")
+
+
+def _backend(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise SystemExit(f"{name} is needed for NPA bounds (pip install {name})")
+
+
+def conic_data(structure, upper):
+    """
+    (A, b) with svec(Γ(z)) = b − A z, z the moments other than ⟨1⟩ = 1.
+    svec stacks one triangle column by column with off-diagonal entries
+    scaled by √2: the upper one for Clarabel, the lower one for SCS.
+    """
+    from scipy import sparse
+
+    index = structure.index
+    n = len(index)
+    rows, cols, vals = [], [], []
+    b = np.zeros(n * (n + 1) // 2)
+    pos = 0
+    for j in range(n):
+        for i in (range(j + 1) if upper else range(j, n)):
+            k, scale = index[i, j], 1.0 if i == j else np.sqrt(2)
+            if k == 0:
+                b[pos] = scale
+            elif k > 0:
+                rows.append(pos)
+                cols.append(k - 1)
+                vals.append(-scale)
+            pos += 1
+    return sparse.csc_matrix((vals, (rows, cols)), shape=(len(b), len(structure.moments) - 1)), b
+
+
+class NPASolver:
+    """
+    One NPA relaxation set up in the backend once; bound() only swaps the
+    objective. Clarabel (interior point, the default) keeps its symbolic
+    setup; SCS keeps its factorisation and warm-starts from the previous
+    solution, which pays off when neighbouring expressions are close.
+    """
+
+    def __init__(self, scenario=CHSH, level="1+AB", backend="clarabel"):
+        from scipy import sparse
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        self.structure = moment_structure(scenario, level)
+        self.backend = backend
+        n, m = len(self.structure.index), len(self.structure.moments)
+        A, b = conic_data(self.structure, upper=backend == "clarabel")
+        if backend == "clarabel":
+            clarabel = _backend("clarabel")
+            settings = clarabel.DefaultSettings()
+            settings.verbose = False
+            self._solver = clarabel.DefaultSolver(sparse.csc_matrix((m - 1, m - 1)), np.zeros(m - 1),
+                                                  A, b, [clarabel.PSDTriangleConeT(n)], settings)
+        else:
+            scs = _backend("scs")
+            self._solver = scs.SCS({"A": A, "b": b, "c": np.zeros(m - 1)}, {"s": [n]},
+                                   eps_abs=1e-6, eps_rel=1e-6, verbose=False)
+        self._warm = None
+
+    def _minimise(self, c):
+        """min c·z over the relaxation."""
+        if self.backend == "clarabel":
+            self._solver.update(q=c)
+            sol = self._solver.solve()
+            if str(sol.status) not in ("Solved", "AlmostSolved"):
+                raise RuntimeError(f"NPA solve failed: {sol.status}")
+            return sol.obj_val
+        self._solver.update(c=c)
+        sol = self._solver.solve(warm_start=self._warm is not None, **(self._warm or {}))
+        if sol["info"]["status_val"] not in (1, 2):          # solved / solved inaccurate
+            raise RuntimeError(f"NPA solve failed: {sol['info']['status']}")
+        self._warm = {key: sol[key] for key in ("x", "y", "s")}
+        return sol["info"]["pobj"]
+
+    def bound(self, bell):
+        """Upper bound on the quantum value of Bell coefficients G[a, b, x, y]."""
+        weights = self.structure.objective @ np.asarray(bell, dtype=float).ravel()
+        return float(weights[0] - self._minimise(-weights[1:]))
+
+    def bounds(self, bells):
+        """bound() for a batch (N, *scenario.shape)."""
+        shape = self.structure.scenario.shape
+        return np.array([self.bound(bell) for bell in np.asarray(bells, dtype=float).reshape(-1, *shape)])
+
+
+@functools.lru_cache(maxsize=None)
+def npa_solver(scenario=CHSH, level="1+AB", backend="clarabel"):
+    """Cached NPASolver per scenario, level and backend."""
+    return NPASolver(scenario, level, backend)
+
+
+def quantum_bound(bell, scenario=CHSH, level="1+AB"):
+    return npa_solver(scenario, level).bound(bell)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NPA upper bounds on quantum Bell values.")
+    parser.add_argument("--random", type=int, default=0,
+                        help="also bound this many random CHSH-scenario correlator expressions")
+    parser.add_argument("--level", choices=LEVELS, default="1+AB", help="level for --random")
+    parser.add_argument("--backend", choices=BACKENDS, default="clarabel")
+    args = parser.parse_args(argv)
+
+    import bell_chsh
+
+    for name, scenario, bell, reference in (
+            ("CHSH", CHSH, bell_chsh.CHSH_FUNCTIONAL, bell_chsh.TSIRELSON_BOUND),
+            ("I3322", I3322, i3322(), None)):
+        for level in LEVELS:
+            start = time.perf_counter()
+            solver = npa_solver(scenario, level, args.backend)
+            value = solver.bound(bell)
+            size = len(solver.structure.index)
+            gap = f"  (gap to 2√2 strategy {value - reference:.1e})" if reference else ""
+            print(f"{name:<6} level {level:<5} Γ {size:>2}×{size:<2} ≤ {value:.6f}  "
+                  f"({time.perf_counter() - start:.2f}s){gap}")
+    if args.random:
+        rng = np.random.default_rng(0)
+        bells = correlator_expression(rng.normal(size=(args.random, 2, 2)))
+        solver = npa_solver(CHSH, args.level, args.backend)
+        start = time.perf_counter()
+        values = solver.bounds(bells)
+        print(f"{args.random} random expressions at level {args.level} in "
+              f"{time.perf_counter() - start:.2f}s (mean bound {values.mean():.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
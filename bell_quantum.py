@@ -0,0 +1,126 @@
+"""
+The exact quantum set in a plane of CHSH correlators.
+
+For two binary measurements per party with unbiased marginals, the
+correlators E_xy are quantum iff (Tsirelson, Landau, Masanes)
+
+  |arcsin E00 + arcsin E01 + arcsin E10 + arcsin E11 − 2 arcsin E_xy| ≤ π
+
+for all four xy. A slice is a plane E = origin + s·basis[0] + t·basis[1]
+through a point of Q. Q is convex, so along every ray from the origin
+membership is an interval; its end is found by bisection, on all rays of
+the angular grid at once.
+
+quantum_boundary() caches the polyline as media/geometry/<key>.npz, the
+key hashing the slice, the grid and the criterion version, so a scene
+loads it instead of recomputing (numpy only, safe for render workers).
+
+Run:
+  python bell_quantum.py                 # the deck's slice: radius, Tsirelson point, cache file
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(__file__).resolve().parent / "media" / "geometry"
+BOUNDARY_VERSION = 1            # bump when the criterion or the bisection changes
+BISECTION_STEPS = 60
+# row k: the sign pattern with the minus on term k (order 00, 01, 10, 11)
+TLM_SIGNS = 1 - 2 * np.eye(4)[::-1]
+
+# CorrelationPolytope's plane: E00 = −E11 = s, E01 = E10 = t. In it L is the
+# square |s| + |t| ≤ 1, Q the unit disk and NS the square max(|s|, |t|) ≤ 1.
+DECK_SLICE = ((1, 0, 0, -1), (0, 1, 1, 0))
+DECK_ANGLES = 360               # points on the drawn boundary; part of the cache key
+
+
+def tlm_margin(correlators):
+    """
+    π − max over the four patterns of |Σ ± arcsin E_xy|, per point of a
+    (..., 2, 2) or (..., 4) correlator array: ≥ 0 exactly on Q.
+    """
+    e = np.asarray(correlators, dtype=float)
+    e = e.reshape(*e.shape[:-2], 4) if e.shape[-2:] == (2, 2) else e
+    angles = np.arcsin(np.clip(e, -1, 1))
+    worst = np.abs(angles @ TLM_SIGNS.T).max(axis=-1)
+    return np.where(np.abs(e).max(axis=-1) <= 1, np.pi - worst, -np.inf)
+
+
+def _plane(basis, origin):
+    basis = np.asarray(basis, dtype=float).reshape(2, 4)
+    origin = np.zeros(4) if origin is None else np.asarray(origin, dtype=float).reshape(4)
+    return basis, origin
+
+
+def radial_extent(theta, basis, origin=None):
+    """Distance (in slice coordinates) from the origin to ∂Q along angles theta."""
+    basis, origin = _plane(basis, origin)
+    if tlm_margin(origin) < 0:
+        raise ValueError("the slice origin must lie in the quantum set")
+    theta = np.asarray(theta, dtype=float)
+    direction = np.cos(theta)[..., None] * basis[0] + np.sin(theta)[..., None] * basis[1]
+    # the correlator cube |E_xy| ≤ 1 caps the search
+    with np.errstate(divide="ignore"):
+        room = np.where(direction > 0, (1 - origin) / direction,
+                        np.where(direction < 0, (-1 - origin) / direction, np.inf))
+    lo, hi = np.zeros(theta.shape), room.min(axis=-1)
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        inside = tlm_margin(origin + mid[..., None] * direction) >= 0
+        lo, hi = np.where(inside, mid, lo), np.where(inside, hi, mid)
+    return lo
+
+
+def slice_key(basis, origin=None, n_angles=DECK_ANGLES):
+    basis, origin = _plane(basis, origin)
+    payload = json.dumps({"basis": basis.tolist(), "origin": origin.tolist(),
+                          "n_angles": n_angles, "version": BOUNDARY_VERSION}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def quantum_boundary(basis, origin=None, n_angles=DECK_ANGLES, cache_dir=CACHE_DIR):
+    """
+    ∂Q in the slice as an (n_angles, 2) polyline of slice coordinates,
+    counter-clockwise from angle 0; read from / written to the .npz cache.
+    """
+    path = Path(cache_dir) / f"quantum-{slice_key(basis, origin, n_angles)}.npz"
+    try:
+        with np.load(path) as cached:
+            return cached["boundary"]
+    except (FileNotFoundError, KeyError, ValueError):
+        pass
+    theta = np.linspace(0, 2 * np.pi, n_angles, endpoint=False)
+    radius = radial_extent(theta, basis, origin)
+    boundary = np.stack([radius * np.cos(theta), radius * np.sin(theta)], axis=1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.part.npz")
+    basis, origin = _plane(basis, origin)
+    np.savez(tmp, boundary=boundary, theta=theta, basis=basis, origin=origin)
+    os.replace(tmp, path)          # workers rendering in parallel may race here
+    return boundary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exact quantum boundary of a correlator slice.")
+    parser.add_argument("--angles", type=int, default=DECK_ANGLES,
+                        help="boundary points (the default is the one CorrelationPolytope reads)")
+    args = parser.parse_args(argv)
+
+    boundary = quantum_boundary(DECK_SLICE, n_angles=args.angles)
+    radius = np.hypot(*boundary.T)
+    corner = radial_extent(np.pi / 4, DECK_SLICE)
+    print(f"slice {DECK_SLICE}: {len(boundary)} points, radius {radius.min():.12f}–{radius.max():.12f}")
+    print(f"Tsirelson point ({corner / np.sqrt(2):.6f}, {corner / np.sqrt(2):.6f}), "
+          f"S = {2 * np.sqrt(2) * corner:.6f}")
+    print(f"cache: {CACHE_DIR / ('quantum-' + slice_key(DECK_SLICE, None, args.angles) + '.npz')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
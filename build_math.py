@@ -0,0 +1,197 @@
+"""
+Build-time KaTeX: typeset every $…$ / $$…$$ / \\(…\\) / \\[…\\] span in the
+decks once, with node and the vendored KaTeX, and drop the RevealMath
+plugin so the browser only has to apply katex.min.css.
+
+Math is found the way KaTeX's auto-render finds it (same delimiters and
+order, brace-aware end search, only inside .reveal .slides, skipping
+script/style/pre/code/textarea/noscript). The decks' own `katex: { trust,
+macros }` options are reused.
+
+Run:
+  python build_math.py index.html              # print stats for a deck
+  python build_site.py build                   # runs this stage for every deck
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+KATEX_JS = ROOT / "vendor" / "katex@0.16.11" / "dist" / "katex.js"
+
+# RevealMath.KaTeX defaults, in auto-render's priority order.
+DELIMITERS = (("$$", "$$", True), ("$", "$", False), ("\\(", "\\)", False), ("\\[", "\\]", True))
+IGNORED_TAGS = {"script", "noscript", "style", "textarea", "pre", "code"}
+
+TOKEN_RE = re.compile(r"<!--.*?-->|<[^>]*>", re.S)
+TAG_RE = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)([^>]*)>")
+
+NODE_RENDER = r"""
+const katex = require(process.env.KATEX_JS);
+let input = '';
+process.stdin.on('data', (d) => { input += d; }).on('end', () => {
+  const { items, options } = JSON.parse(input);
+  const out = items.map(([tex, display]) => katex.renderToString(tex,
+    Object.assign({}, options, { displayMode: display, throwOnError: false })));
+  process.stdout.write(JSON.stringify(out));
+});
+"""
+
+
+# ─────────────────────────────────────────────────────────
+# Finding math (mirrors katex/contrib/auto-render)
+# ─────────────────────────────────────────────────────────
+def _find_end(delimiter, text, start):
+    i, level = start, 0
+    while i < len(text):
+        if level <= 0 and text.startswith(delimiter, i):
+            return i
+        ch = text[i]
+        if ch == "\\":
+            i += 1
+        elif ch == "{":
+            level += 1
+        elif ch == "}":
+            level -= 1
+        i += 1
+    return -1
+
+
+def split_math(text):
+    """Split plain text into [str | (tex, display)] pieces."""
+    pieces = []
+    left_re = re.compile("|".join(re.escape(left) for left, _, _ in DELIMITERS))
+    while True:
+        m = left_re.search(text)
+        if not m:
+            break
+        left, right, display = next(d for d in DELIMITERS if d[0] == m.group())
+        end = _find_end(right, text, m.end())
+        if end == -1:
+            break
+        if m.start():
+            pieces.append(text[:m.start()])
+        pieces.append((text[m.end():end], display))
+        text = text[end + len(right):]
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+def math_pieces(page):
+    """Tokenise page into [str | (tex, display)]; raw HTML is kept verbatim."""
+    out = []
+    ignored = 0
+    slides_depth = 0          # >0 while inside <div class="slides">
+    pos = 0
+    for m in TOKEN_RE.finditer(page):
+        text = page[pos:m.start()]
+        if slides_depth and not ignored and text:
+            parts = split_math(html.unescape(text))
+            if any(isinstance(p, tuple) for p in parts):
+                out.extend(p if isinstance(p, tuple) else html.escape(p, quote=False)
+                           for p in parts)
+            else:
+                out.append(text)
+        else:
+            out.append(text)
+        out.append(m.group())
+        pos = m.end()
+
+        tag = TAG_RE.match(m.group())
+        if not tag:
+            continue
+        closing, name, attrs = tag.group(1), tag.group(2).lower(), tag.group(3)
+        if name in IGNORED_TAGS and not attrs.rstrip().endswith("/"):
+            ignored += -1 if closing else 1
+            ignored = max(ignored, 0)
+        elif name == "div":
+            if slides_depth:
+                slides_depth += -1 if closing else 1
+            elif not closing and re.search(r'class="[^"]*\bslides\b', attrs):
+                slides_depth = 1
+    out.append(page[pos:])
+    return out
+
+
+# ─────────────────────────────────────────────────────────
+# Rendering
+# ─────────────────────────────────────────────────────────
+def katex_options(page):
+    """The deck's `katex: {…}` trust/macros settings."""
+    options = {}
+    start = page.find("katex: {")
+    if start == -1:
+        return options
+    if re.compile(r"katex:\s*\{[^}]*?\btrust:\s*true").match(page, start):
+        options["trust"] = True
+    macros = re.compile(r"katex:\s*\{[^}]*?macros:\s*\{").match(page, start)
+    if macros:
+        string = r'"((?:\\.|[^"\\])*)"'
+        pair = re.compile(r"\s*" + string + r"\s*:\s*" + string + r"\s*,?")
+        options["macros"] = {}
+        pos = macros.end()
+        while m := pair.match(page, pos):
+            options["macros"][json.loads(f'"{m.group(1)}"')] = json.loads(f'"{m.group(2)}"')
+            pos = m.end()
+    return options
+
+
+def render_katex(items, options, katex_js=KATEX_JS):
+    """[(tex, display)] → [html] in one node process."""
+    if not items:
+        return []
+    if not shutil.which("node"):
+        raise SystemExit("node is needed to pre-render math")
+    if not Path(katex_js).exists():
+        raise SystemExit(f"{katex_js} is missing; run `python build_site.py vendor`")
+    proc = subprocess.run(["node", "-e", NODE_RENDER], input=json.dumps(
+        {"items": items, "options": options}), capture_output=True, text=True, check=True,
+        env={**os.environ, "KATEX_JS": str(katex_js)})
+    return json.loads(proc.stdout)
+
+
+def strip_runtime(page):
+    """Remove the RevealMath plugin; katex.min.css stays for layout."""
+    page = re.sub(r"\n[ \t]*<script src=\"[^\"]*/plugin/math/math\.js\"></script>", "", page)
+    return re.sub(r"RevealMath\.KaTeX,\s*", "", page)
+
+
+def prerender(page, katex_js=KATEX_JS):
+    """Return (page with math typeset, number of math spans)."""
+    pieces = math_pieces(page)
+    items = sorted({p for p in pieces if isinstance(p, tuple)})
+    rendered = dict(zip(items, render_katex([list(i) for i in items], katex_options(page),
+                                            katex_js)))
+    out = "".join(rendered[p] if isinstance(p, tuple) else p for p in pieces)
+    return strip_runtime(out), sum(isinstance(p, tuple) for p in pieces)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-render deck math with KaTeX.")
+    parser.add_argument("decks", nargs="+", type=Path)
+    parser.add_argument("-o", "--out", type=Path, help="output directory (default: stats only)")
+    args = parser.parse_args(argv)
+
+    for deck in args.decks:
+        page = deck.read_text(encoding="utf-8")
+        if args.out is None:
+            spans = [p for p in math_pieces(page) if isinstance(p, tuple)]
+            print(f"{deck}: {len(spans)} math spans ({len(set(spans))} distinct)")
+            continue
+        page, count = prerender(page)
+        args.out.mkdir(parents=True, exist_ok=True)
+        (args.out / deck.name).write_text(page, encoding="utf-8")
+        print(f"{deck} → {args.out / deck.name}  ({count} math spans)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+Deck page generator: one source per deck, shared CSS/JS pulled out of the
+pages into fingerprinted static files, everything minified.
+
+  • presentation.html is generated from index.html (PAGES below), so the
+    two URLs no longer need two copies of the deck in the tree.
+  • CSS rules shared by a group of decks (STYLE_GROUPS) go into
+    static/<group>-<hash>.css, the rest into one file per distinct
+    stylesheet. A rule is only shared when moving it ahead of the deck's
+    own rules cannot change the cascade (same relative order everywhere,
+    no earlier deck rule on the same selector).
+  • Inline scripts become static/<page>-<hash>.js, deduplicated by content,
+    at the same position in the page, so execution order is unchanged.
+
+The file names change only when the content does, so browsers (and sw.js)
+can keep them indefinitely; _headers says so to hosts that read it.
+
+Run:
+  python build_pages.py               # report what would be shared
+  python build_site.py build          # uses this for dist/
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# output page → source deck
+PAGES = {
+    "index.html": "index.html",
+    "presentation.html": "index.html",
+    "speaker1.html": "speaker1.html",
+    "speaker2.html": "speaker2.html",
+}
+
+STYLE_RE = re.compile(r"[ \t]*<style>(.*?)</style>\n?", re.S)
+SCRIPT_RE = re.compile(r"<script>(.*?)</script>", re.S)
+# Shared stylesheets, loaded in this order before a page's own CSS.
+STYLE_GROUPS = (
+    ("deck-common", tuple(PAGES)),
+    ("speaker-common", ("speaker1.html", "speaker2.html")),
+)
+
+RAW_BLOCK_RE = re.compile(r"<(pre|textarea)\b.*?</\1>", re.S)
+
+HEADERS = """\
+/static/*
+  Cache-Control: public, max-age=31536000, immutable
+"""
+
+
+def digest(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]
+
+
+def load_sources(root=ROOT):
+    return {page: (root / src).read_text(encoding="utf-8") for page, src in PAGES.items()}
+
+
+# ─────────────────────────────────────────────────────────
+# Minifiers (conservative: comments and whitespace only)
+# ─────────────────────────────────────────────────────────
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js):
+    """Drop comments and indentation; newlines stay so ASI is untouched."""
+    out, i, n = [], 0, len(js)
+    while i < n:
+        ch = js[i]
+        if ch in "'\"`":
+            j = i + 1
+            while j < n and js[j] != ch:
+                j += 2 if js[j] == "\\" else 1
+            out.append(js[i:j + 1])
+            i = j + 1
+        elif js.startswith("//", i):
+            i = js.find("\n", i) if "\n" in js[i:] else n
+        elif js.startswith("/*", i):
+            i = js.find("*/", i) + 2
+        else:
+            out.append(ch)
+            i += 1
+    lines = (line.strip() for line in "".join(out).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def minify_html(page):
+    """Drop comments, indentation and blank lines outside <pre>/<textarea>."""
+    def squeeze(chunk):
+        chunk = re.sub(r"<!--(?!\[if).*?-->", "", chunk, flags=re.S)
+        lines = (line.strip() for line in chunk.splitlines())
+        return "\n".join(line for line in lines if line)
+
+    out, pos = [], 0
+    for m in RAW_BLOCK_RE.finditer(page):
+        out += [squeeze(page[pos:m.start()]), m.group()]
+        pos = m.end()
+    out.append(squeeze(page[pos:]))
+    return "".join(out) + "\n"
+
+
+# ─────────────────────────────────────────────────────────
+# Shared CSS
+# ─────────────────────────────────────────────────────────
+def split_rules(css):
+    """Minified top-level rules (an @media block counts as one rule)."""
+    css = minify_css(css)
+    rules, depth, start = [], 0, 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+    return rules
+
+
+def _selectors(rule):
+    return set(rule.split("{", 1)[0].split(","))
+
+
+def shared_rules(rule_lists, hoisted=()):
+    """
+    Rules common to every list that can be hoisted without changing the
+    cascade. hoisted are rules already moved into an earlier stylesheet.
+    """
+    if not rule_lists:
+        return []
+    first, others = rule_lists[0], rule_lists[1:]
+    candidates = [r for r in dict.fromkeys(first)
+                  if r not in hoisted and all(r in rules for rules in others)]
+    shared, cursors = [], [0] * len(rule_lists)
+    for rule in candidates:
+        positions = [rules.index(rule, c) if rule in rules[c:] else -1
+                     for rules, c in zip(rule_lists, cursors)]
+        if -1 in positions:
+            continue
+        sel = _selectors(rule)
+        hoistable = all(
+            not (_selectors(r) & sel)
+            for rules, p in zip(rule_lists, positions)
+            for r in rules[:p] if r not in shared and r not in hoisted
+        ) and all(
+            not (_selectors(r) & sel)
+            for rules, p in zip(rule_lists, positions)
+            for r in rules[p + 1:] if r in hoisted)
+        if hoistable:
+            shared.append(rule)
+            cursors = [p + 1 for p in positions]
+    return shared
+
+
+def plan_styles(pages):
+    """{group stem: shared rules} and {page: own rules}, following STYLE_GROUPS."""
+    rules = {name: [r for css in STYLE_RE.findall(html) for r in split_rules(css)]
+             for name, html in pages.items()}
+    groups, hoisted = {}, []
+    for stem, members in STYLE_GROUPS:
+        members = [m for m in members if m in rules]
+        groups[stem] = shared_rules([rules[m] for m in members], hoisted) if members else []
+        hoisted += groups[stem]
+    own = {name: [r for r in page_rules if r not in hoisted] for name, page_rules in rules.items()}
+    return groups, own
+
+
+# ─────────────────────────────────────────────────────────
+# Generation
+# ─────────────────────────────────────────────────────────
+def generate(pages, out_dir, minify=True):
+    """
+    Move inline CSS/JS of pages ({name: html}) into out_dir/static/ and
+    return the rewritten pages. File names are content-addressed, so
+    identical stylesheets and scripts are written (and downloaded) once.
+    """
+    static = Path(out_dir) / "static"
+    static.mkdir(parents=True, exist_ok=True)
+    urls = {}
+
+    def emit(stem, suffix, text):
+        if text not in urls:
+            urls[text] = f"static/{stem}-{digest(text)}{suffix}"
+            (Path(out_dir) / urls[text]).write_text(text, encoding="utf-8")
+        return urls[text]
+
+    groups, own = plan_styles(pages)
+
+    result = {}
+    for name, html in pages.items():
+        stem = name.rsplit(".", 1)[0]
+        links = [emit(group, ".css", "".join(groups[group]))
+                 for group, members in STYLE_GROUPS if name in members and groups[group]]
+        if own[name]:
+            links.append(emit(stem, ".css", "".join(own[name])))
+        tags = "".join(f'  <link rel="stylesheet" href="{u}" />\n' for u in links)
+        seen = []
+
+        def stylesheet(m):
+            # the links replace the first <style>; later ones are folded into them
+            seen.append(m)
+            return tags if len(seen) == 1 else ""
+
+        html = STYLE_RE.sub(stylesheet, html)
+
+        def external(m):
+            js = minify_js(m.group(1)) if minify else m.group(1).strip() + "\n"
+            return f'<script src="{emit(stem, ".js", js)}"></script>'
+
+        html = SCRIPT_RE.sub(external, html)
+        result[name] = minify_html(html) if minify else html
+
+    (Path(out_dir) / "_headers").write_text(HEADERS, encoding="utf-8")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report CSS/JS shared between the decks.")
+    parser.parse_args(argv)
+
+    pages = load_sources()
+    groups, own = plan_styles(pages)
+    for group, shared in groups.items():
+        print(f"{group}.css: {len(shared)} rules, {len(''.join(shared)) / 1024:.1f} KiB")
+    for name, html in pages.items():
+        print(f"  {name:<18} {len(html) / 1024:6.1f} KiB source, "
+              f"{len(''.join(own[name])) / 1024:5.1f} KiB own CSS, "
+              f"{sum(len(s) for s in SCRIPT_RE.findall(html)) / 1024:5.1f} KiB inline JS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""
+Offline build of the decks: vendored reveal.js / KaTeX / Inter, fingerprinted
+static files and a service worker that precaches everything.
+
+`vendor` downloads the pinned npm packages and the Inter web font into
+vendor/ and records the sha512 of every download in vendor.lock.json
+(commit it; later runs fail on bytes that differ). `vendor --frozen`, which
+CI runs, also fails on downloads missing from the lock instead of adding
+them, so the deployed bundle only ever contains reviewed bytes.
+`build` writes dist/: the decks generated by build_pages.py with their
+math pre-rendered (build_math.py), every CDN URL pointing at
+static/<package>-<hash>/ and shared CSS/JS in fingerprinted files,
+the scene videos the decks reference (render_deps.py) with their
+chapters and posters (the chapters <track>, poster= and the slide-map
+sprite are linked only for files that exist), and sw.js, which precaches
+the HTML, scripts, stylesheets, fonts and videos so the deck starts
+from local cache and works with no network.
+
+Run:
+  python build_site.py vendor          # once, needs network
+  python build_site.py build           # → dist/
+  python -m http.server -d dist        # serve it (service workers need http)
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import re
+import shutil
+import sys
+import tarfile
+import urllib.request
+from pathlib import Path
+
+import build_math
+import build_pages
+import render_deps
+import render_posters
+import render_timeline
+
+ROOT = Path(__file__).resolve().parent
+VENDOR_DIR = ROOT / "vendor"
+LOCK_PATH = ROOT / "vendor.lock.json"
+DIST_DIR = ROOT / "dist"
+ASSETS_DIR = ROOT / "assets"
+
+# npm package → (version, subtrees kept from the tarball)
+PACKAGES = {
+    "reveal.js": ("5.1.0", ("dist", "plugin")),
+    "katex": ("0.16.11", ("dist",)),
+}
+CDN = "https://cdn.jsdelivr.net/npm/"
+
+FONTS_CSS = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap"
+# Google serves woff2 only to browsers it recognises.
+FONTS_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+
+# Files worth precaching; the rest (source maps, ttf/woff fallbacks) stays on demand.
+PRECACHE_SUFFIXES = {".html", ".js", ".css", ".woff2", ".webm", ".vtt", ".webp"}
+ASSET_PATTERNS = ("*.webm", "*.vtt", "posters/*.webp", "posters/sprite.css")
+SKIP_SUFFIXES = {".map"}
+
+
+# ─────────────────────────────────────────────────────────
+# Vendoring
+# ─────────────────────────────────────────────────────────
+def _fetch(url, headers=None):
+    req = urllib.request.Request(url, headers=headers or {})
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        return resp.read()
+
+
+def _sri(data):
+    return "sha512-" + base64.b64encode(hashlib.sha512(data).digest()).decode("ascii")
+
+
+def load_lock():
+    if LOCK_PATH.exists():
+        return json.loads(LOCK_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+def _check(lock, key, data, expected=None, frozen=False):
+    """
+    Verify data against the lock (or the registry's integrity) and record
+    it. With frozen, data the lock does not pin is an error.
+    """
+    digest = _sri(data)
+    if frozen and key not in lock:
+        raise RuntimeError(f"{key}: not pinned in {LOCK_PATH.name} "
+                           "(run `python build_site.py vendor` and commit it)")
+    pinned = lock.get(key) or expected
+    if pinned and pinned != digest:
+        raise RuntimeError(f"{key}: integrity mismatch (expected {pinned}, got {digest})")
+    lock[key] = digest
+
+
+def vendor_package(name, version, keep, lock, frozen=False):
+    meta = json.loads(_fetch(f"https://registry.npmjs.org/{name}/{version}"))
+    data = _fetch(meta["dist"]["tarball"])
+    _check(lock, f"{name}@{version}", data, meta["dist"].get("integrity"), frozen)
+
+    dest = VENDOR_DIR / f"{name}@{version}"
+    shutil.rmtree(dest, ignore_errors=True)
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        for member in tar.getmembers():
+            rel = member.name.split("/", 1)[-1]          # strip "package/"
+            if not member.isfile() or rel.split("/", 1)[0] not in keep:
+                continue
+            if Path(rel).suffix in SKIP_SUFFIXES:
+                continue
+            target = dest / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(tar.extractfile(member).read())
+    return dest
+
+
+def vendor_fonts(lock, frozen=False):
+    css = _fetch(FONTS_CSS, {"User-Agent": FONTS_UA}).decode("utf-8")
+    dest = VENDOR_DIR / "fonts"
+    shutil.rmtree(dest, ignore_errors=True)
+    dest.mkdir(parents=True)
+
+    def localise(match):
+        url = match.group(1)
+        name = url.rsplit("/", 1)[-1]
+        data = _fetch(url)
+        _check(lock, f"fonts/{name}", data, frozen=frozen)
+        (dest / name).write_bytes(data)
+        return f"url({name})"
+
+    css = re.sub(r"url\((https://fonts\.gstatic\.com/[^)]+)\)", localise, css)
+    (dest / "inter.css").write_text(css, encoding="utf-8")
+    return dest
+
+
+def vendor(frozen=False):
+    lock = load_lock()
+    if frozen and not lock:
+        raise SystemExit(f"{LOCK_PATH.name} is missing: run `python build_site.py vendor` "
+                         "and commit it")
+    VENDOR_DIR.mkdir(exist_ok=True)
+    for name, (version, keep) in PACKAGES.items():
+        print(f"vendor/{vendor_package(name, version, keep, lock, frozen).name}")
+    print(f"vendor/{vendor_fonts(lock, frozen).name}")
+    if frozen:
+        return
+    LOCK_PATH.write_text(json.dumps(lock, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+# ─────────────────────────────────────────────────────────
+# Build
+# ─────────────────────────────────────────────────────────
+def tree_digest(path):
+    """Short content hash of a directory (relative paths + bytes)."""
+    h = hashlib.sha256()
+    for f in sorted(p for p in Path(path).rglob("*") if p.is_file()):
+        h.update(f.relative_to(path).as_posix().encode("utf-8") + b"\0")
+        h.update(f.read_bytes())
+    return h.hexdigest()[:10]
+
+
+def copy_fingerprinted(src, out_dir, stem):
+    """Copy directory src to out_dir/static/<stem>-<hash>/; return its site-relative URL."""
+    url = f"static/{stem}-{tree_digest(src)}"
+    dest = out_dir / url
+    if not dest.exists():
+        shutil.copytree(src, dest)
+    return url
+
+
+def static_urls(out_dir):
+    """Copy the vendored trees into out_dir; map CDN prefixes to local URLs."""
+    missing = [n for n in [f"{n}@{v}" for n, (v, _) in PACKAGES.items()] + ["fonts"]
+               if not (VENDOR_DIR / n).is_dir()]
+    if missing:
+        raise SystemExit(f"vendor/ is missing {', '.join(missing)}; run `python build_site.py vendor`")
+    urls = {}
+    for name, (version, _) in PACKAGES.items():
+        urls[f"{CDN}{name}@{version}"] = copy_fingerprinted(VENDOR_DIR / f"{name}@{version}",
+                                                            out_dir, name)
+    urls[FONTS_CSS] = copy_fingerprinted(VENDOR_DIR / "fonts", out_dir, "fonts") + "/inter.css"
+    return urls
+
+
+SW_REGISTER = """
+  <script>
+    if ('serviceWorker' in navigator && location.protocol !== 'file:') {
+      navigator.serviceWorker.register('sw.js');
+    }
+  </script>
+"""
+
+
+def localise_html(html, urls):
+    """Point CDN references at the local copies and register the service worker."""
+    html = re.sub(r'\s*<link rel="preconnect" href="https://fonts\.(googleapis|gstatic)\.com"[^>]*>',
+                  "", html)
+    html = html.replace(FONTS_CSS.replace("&", "&amp;"), urls[FONTS_CSS])
+    for prefix in sorted(urls, key=len, reverse=True):
+        html = html.replace(prefix, urls[prefix])
+    leftover = re.findall(r"https://(?:cdn\.jsdelivr\.net|fonts\.googleapis\.com)[^\"' )]*", html)
+    if leftover:
+        raise ValueError(f"unvendored CDN references: {sorted(set(leftover))}")
+    return html.replace("</body>", SW_REGISTER + "</body>", 1)
+
+
+SW_TEMPLATE = """\
+// Generated by build_site.py; do not edit.
+const CACHE = 'tsirelson-deck-__VERSION__';
+const PRECACHE = __PRECACHE__;
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(caches.open(CACHE).then((cache) => cache.addAll(PRECACHE))
+    .then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(caches.keys().then((keys) => Promise.all(keys
+    .filter((k) => k.startsWith('tsirelson-deck-') && k !== CACHE)
+    .map((k) => caches.delete(k)))).then(() => self.clients.claim()));
+});
+
+// <video> asks for byte ranges; answer them from the cached full response.
+async function rangeResponse(request, response) {
+  const blob = await response.blob();
+  const m = /bytes=(\\d*)-(\\d*)/.exec(request.headers.get('range') || '');
+  const start = m && m[1] ? Number(m[1]) : 0;
+  const end = m && m[2] ? Math.min(Number(m[2]), blob.size - 1) : blob.size - 1;
+  return new Response(blob.slice(start, end + 1), {
+    status: 206,
+    headers: {
+      'Content-Type': response.headers.get('Content-Type') || 'video/webm',
+      'Content-Length': String(end - start + 1),
+      'Content-Range': `bytes ${start}-${end}/${blob.size}`,
+      'Accept-Ranges': 'bytes',
+    },
+  });
+}
+
+self.addEventListener('fetch', (event) => {
+  const request = event.request;
+  if (request.method !== 'GET' || new URL(request.url).origin !== location.origin) return;
+  event.respondWith(caches.match(request, { ignoreSearch: true }).then((cached) => {
+    if (!cached) return fetch(request);
+    return request.headers.has('range') ? rangeResponse(request, cached) : cached;
+  }));
+});
+"""
+
+
+def write_service_worker(out_dir):
+    files = sorted(p.relative_to(out_dir).as_posix() for p in out_dir.rglob("*")
+                   if p.is_file() and p.suffix in PRECACHE_SUFFIXES)
+    h = hashlib.sha256()
+    for rel in files:
+        h.update(rel.encode("utf-8") + b"\0" + (out_dir / rel).read_bytes())
+    precache = ["./"] + files
+    sw = (SW_TEMPLATE.replace("__VERSION__", h.hexdigest()[:10])
+          .replace("__PRECACHE__", json.dumps(precache, indent=2)))
+    (out_dir / "sw.js").write_text(sw, encoding="utf-8")
+    return precache
+
+
+def build(out_dir=DIST_DIR, prerender_math=True, minify=True):
+    out_dir = Path(out_dir)
+    shutil.rmtree(out_dir, ignore_errors=True)
+    out_dir.mkdir(parents=True)
+
+    urls = static_urls(out_dir)
+    pages = build_pages.load_sources()
+    for name, html in pages.items():
+        if prerender_math:
+            html, _ = build_math.prerender(html)
+        pages[name] = localise_html(render_posters.link_posters(render_timeline.link_chapters(html)), urls)
+    for name, html in build_pages.generate(pages, out_dir, minify).items():
+        (out_dir / name).write_text(html, encoding="utf-8")
+
+    # videos no deck links to (and their chapters/posters) stay out of dist/
+    shipped = {Path(target).stem for target in render_deps.referenced_videos()} | {"sprite"}
+    for pattern in ASSET_PATTERNS:
+        for asset in sorted(ASSETS_DIR.glob(pattern)):
+            if asset.stem not in shipped:
+                continue
+            dest = out_dir / "assets" / asset.relative_to(ASSETS_DIR)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(asset, dest)
+
+    precache = write_service_worker(out_dir)
+    size = sum((out_dir / rel).stat().st_size for rel in precache[1:])
+    print(f"{out_dir}: {len(pages)} decks, {len(precache)} precached files "
+          f"({size / 2**20:.1f} MiB)")
+    return out_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the offline deck bundle.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    vendor_cmd = sub.add_parser("vendor", help="download pinned reveal.js, KaTeX and Inter into vendor/")
+    vendor_cmd.add_argument("--frozen", action="store_true",
+                            help=f"fail on downloads {LOCK_PATH.name} does not pin (CI)")
+    build_cmd = sub.add_parser("build", help="write the offline site")
+    build_cmd.add_argument("--out", type=Path, default=DIST_DIR)
+    build_cmd.add_argument("--no-prerender-math", action="store_true",
+                           help="keep typesetting math in the browser (no node needed)")
+    build_cmd.add_argument("--no-minify", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "vendor":
+        vendor(args.frozen)
+    else:
+        build(args.out, prerender_math=not args.no_prerender_math, minify=not args.no_minify)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,10 @@ Run: manim -qh --format=webm manim_scenes.py <SceneName>
 from manim import *
 import numpy as np
 
+from bell_chsh import CLASSICAL_BOUND, NO_SIGNALLING_BOUND, TSIRELSON_BOUND
+from bell_local import correlator_section
+from bell_quantum import DECK_ANGLES, DECK_SLICE, quantum_boundary, radial_extent
+
 
 # ─────────────────────────────────────────────────────────
 # Scene 1: Correlation Polytope  →  assets/1_polytope.webm
@@ -14,8 +18,9 @@ class CorrelationPolytope(Scene):
     """
     Shows the hierarchy:
       Local (inner square) ⊂ Quantum (circle-ish convex body) ⊂ No-Signaling (outer square)
-    The CHSH space is parametrized by two coordinates related to
-    correlators. We animate the three nested sets.
+    The plane is bell_quantum.DECK_SLICE, drawn with the correlators rescaled to
+    [0, 1] (the PR box sits at the corner (1, 1)). We animate the three
+    nested sets.
     """
 
     def construct(self):
@@ -53,16 +58,12 @@ class CorrelationPolytope(Scene):
             axes.c2p(0.92, 0.92)
         )
 
-        # ---- Local square (inner, rotated 45°) ----
-        # The local polytope in the CHSH slice is a square rotated 45° inside the NS square
-        cx, cy = 0.5, 0.5
-        r_local = 0.25 * np.sqrt(2)  # half-diagonal
-        local_vertices = [
-            axes.c2p(cx, cy + r_local),
-            axes.c2p(cx + r_local, cy),
-            axes.c2p(cx, cy - r_local),
-            axes.c2p(cx - r_local, cy),
-        ]
+        def slice_point(x, y):
+            return axes.c2p((x + 1) / 2, (y + 1) / 2)
+
+        # ---- Local polygon (inner) ----
+        # The section of the local polytope by the slice (a square rotated 45°)
+        local_vertices = [slice_point(x, y) for x, y in correlator_section(DECK_SLICE)]
         local_square = Polygon(
             *local_vertices,
             color="#44aaff",
@@ -75,18 +76,9 @@ class CorrelationPolytope(Scene):
         )
 
         # ---- Quantum set (convex body between L and NS) ----
-        # We approximate it as a rounded shape (circle inscribed between the two squares)
-        # In the CHSH correlation space, the quantum set is a disk of radius 1/(2√2)
-        # centered at (0.5, 0.5) in our coordinates — actually it's more complex,
-        # but visually we represent it as a smooth convex body.
-        n_pts = 100
-        theta = np.linspace(0, 2 * np.pi, n_pts)
-        # Use a superellipse to get a shape between circle and square
-        quantum_r = 0.42  # tuned for visual
-        exp_param = 2.5   # superellipse exponent (2=circle, ∞=square)
-        qx = cx + quantum_r * np.sign(np.cos(theta)) * np.abs(np.cos(theta)) ** (2 / exp_param)
-        qy = cy + quantum_r * np.sign(np.sin(theta)) * np.abs(np.sin(theta)) ** (2 / exp_param)
-        quantum_pts = [axes.c2p(qx[i], qy[i]) for i in range(n_pts)]
+        # Exact boundary from the arcsine (TLM) criterion, cached in media/geometry/
+        boundary = quantum_boundary(DECK_SLICE, n_angles=DECK_ANGLES)
+        quantum_pts = [slice_point(x, y) for x, y in boundary]
         quantum_body = Polygon(
             *quantum_pts,
             color="#aa44ff",
@@ -95,7 +87,7 @@ class CorrelationPolytope(Scene):
             stroke_width=2.5,
         )
         quantum_label = MathTex(r"\mathcal{Q}", font_size=34, color="#aa44ff").move_to(
-            axes.c2p(0.72, 0.72)
+            axes.c2p(0.8, 0.8)
         )
 
         # ---- PR-box dot ----
@@ -113,9 +105,9 @@ class CorrelationPolytope(Scene):
 
         # ---- S-value annotation ----
         s_text = VGroup(
-            MathTex(r"S \leq 3", font_size=26, color="#44aaff"),
+            MathTex(rf"S \leq {CLASSICAL_BOUND:g}", font_size=26, color="#44aaff"),
             MathTex(r"S \leq 2\sqrt{2}", font_size=26, color="#aa44ff"),
-            MathTex(r"S \leq 4", font_size=26, color="#ff4444"),
+            MathTex(rf"S \leq {NO_SIGNALLING_BOUND:g}", font_size=26, color="#ff4444"),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.15).to_edge(RIGHT).shift(DOWN * 1.0 + LEFT * 0.3)
 
         # ============== ANIMATION ==============
@@ -163,9 +155,10 @@ class CorrelationPolytope(Scene):
             run_time=1.5,
         )
 
-        # 6) Pulse the gap
+        # 6) Pulse the gap: from Tsirelson's point on ∂Q to the PR box
+        ts = radial_extent(np.pi / 4, DECK_SLICE) / np.sqrt(2)
         gap_arrow = Arrow(
-            axes.c2p(0.85, 0.88),
+            slice_point(ts, ts),
             axes.c2p(0.97, 0.97),
             color=YELLOW,
             stroke_width=3,
@@ -448,9 +441,10 @@ class CHSHBars(Scene):
 
         # values
         labels = ["Classical\n(Local)", "Quantum\n(Tsirelson)", "PR-Box\n(No-Signal.)"]
-        values = [3.0, 2 * np.sqrt(2), 4.0]
+        values = [CLASSICAL_BOUND, TSIRELSON_BOUND, NO_SIGNALLING_BOUND]
         colors = ["#44aaff", "#aa44ff", "#ff4444"]
-        value_strs = [r"S=3", r"S=2\sqrt{2}\approx 3.41", r"S=4"]
+        value_strs = [rf"S={values[0]:g}", rf"S=2\sqrt{{2}}\approx {values[1]:.2f}",
+                      rf"S={values[2]:g}"]
 
         bar_width = 1.2
         spacing = 2.0
@@ -463,7 +457,7 @@ class CHSHBars(Scene):
 
         for i, (lbl, val, col, vs) in enumerate(zip(labels, values, colors, value_strs)):
             x = (i - 1) * spacing
-            h = (val / 4.0) * max_h
+            h = (val / NO_SIGNALLING_BOUND) * max_h
 
             bar = Rectangle(
                 width=bar_width, height=h,
@@ -484,7 +478,7 @@ class CHSHBars(Scene):
         ).move_to([0, base_y, 0])
 
         # Tsirelson bound line
-        tsirelson_y = base_y + ((2 * np.sqrt(2)) / 4.0) * max_h
+        tsirelson_y = base_y + (TSIRELSON_BOUND / NO_SIGNALLING_BOUND) * max_h
         tsirelson_line = DashedLine(
             LEFT * 3.5 + UP * tsirelson_y,
             RIGHT * 3.5 + UP * tsirelson_y,
@@ -6,6 +6,8 @@ Run: manim -qh --format=webm manim_scenes_extra.py <SceneName>
 from manim import *
 import numpy as np
 
+from bell_chsh import CLASSICAL_BOUND, NO_SIGNALLING_BOUND, TSIRELSON_BOUND
+
 
 # ─────────────────────────────────────────────────────────
 # Scene: DPI Visualization  →  assets/5_dpi.webm
@@ -445,7 +447,7 @@ class CompositeScene(Scene):
 class CHSHBarsV2(Scene):
     """
     Bar chart with standard CHSH convention:
-    Classical S ≤ 2, Quantum S ≤ 2+√2, No-Signaling S ≤ 4.
+    Classical S ≤ 2, Quantum S ≤ 2√2, No-Signaling S ≤ 4.
     """
 
     def construct(self):
@@ -456,9 +458,10 @@ class CHSHBarsV2(Scene):
         self.play(Write(title), run_time=0.8)
 
         labels = ["Classical\n(Local)", "Quantum\n(Tsirelson)", "PR-Box\n(No-Signal.)"]
-        values = [2.0, 2 * np.sqrt(2), 4.0]
+        values = [CLASSICAL_BOUND, TSIRELSON_BOUND, NO_SIGNALLING_BOUND]
         colors = ["#44aaff", "#aa44ff", "#ff4444"]
-        value_strs = [r"S \leq 2", r"S \leq 2\sqrt{2} \approx 2.83", r"S = 4"]
+        value_strs = [rf"S \leq {values[0]:g}", rf"S \leq 2\sqrt{{2}} \approx {values[1]:.2f}",
+                      rf"S = {values[2]:g}"]
 
         bar_width = 1.2
         spacing = 2.0
@@ -471,7 +474,7 @@ class CHSHBarsV2(Scene):
 
         for i, (lbl, val, col, vs) in enumerate(zip(labels, values, colors, value_strs)):
             x = (i - 1) * spacing
-            h = (val / 4.0) * max_h
+            h = (val / NO_SIGNALLING_BOUND) * max_h
 
             bar = Rectangle(width=bar_width, height=h, color=col,
                             fill_color=col, fill_opacity=0.6, stroke_width=2
@@ -487,7 +490,7 @@ class CHSHBarsV2(Scene):
         baseline = Line(LEFT * 3, RIGHT * 3, color=GREY, stroke_width=1
                         ).move_to([0, base_y, 0])
 
-        tsirelson_y = base_y + ((2 * np.sqrt(2)) / 4.0) * max_h
+        tsirelson_y = base_y + (TSIRELSON_BOUND / NO_SIGNALLING_BOUND) * max_h
         tsirelson_line = DashedLine(LEFT * 3.5, RIGHT * 3.5,
                                     color=YELLOW, stroke_width=2,
                                     dash_length=0.15).move_to([0, tsirelson_y, 0])
@@ -9,11 +9,15 @@ Run all:
 from manim import *
 import numpy as np
 
+from bell_chsh import (CLASSICAL_BOUND, NO_SIGNALLING_BOUND, TSIRELSON_BOUND,
+                       chsh_terms, pr_box)
+from bell_ic import DECK_DEPTH, information
+
 
 # ─────────────────────────────────────────────────────────
 # Scene 1: Tsirelson Gauge   →  assets/s2_tsirelson_gauge.webm
 # An animated "speedometer" gauge that sweeps from 0→4,
-# marking Classical(2), Tsirelson(2+√2), and NS(4) regions.
+# marking Classical(2), Tsirelson(2√2), and NS(4) regions.
 # ─────────────────────────────────────────────────────────
 class TsirelsonGauge(Scene):
     def construct(self):
@@ -28,7 +32,7 @@ class TsirelsonGauge(Scene):
 
         def s_to_angle(s):
             """Map S ∈ [0, 4] to angle on the gauge."""
-            return start_angle - (s / 4.0) * arc_span
+            return start_angle - (s / NO_SIGNALLING_BOUND) * arc_span
 
         # Background arc (full)
         bg_arc = Arc(radius=radius, start_angle=end_angle, angle=arc_span,
@@ -36,20 +40,20 @@ class TsirelsonGauge(Scene):
 
         # Classical zone: 0 → 2 (blue)
         classical_arc = Arc(radius=radius, start_angle=s_to_angle(0),
-                            angle=-(2/4)*arc_span,
+                            angle=-(CLASSICAL_BOUND / NO_SIGNALLING_BOUND) * arc_span,
                             color="#44aaff", stroke_width=16,
                             stroke_opacity=0.6, arc_center=center)
 
-        # Quantum zone: 2 → 2+√2 (purple)
-        q_start = s_to_angle(2)
-        q_span = -(((2 * np.sqrt(2)) - 2) / 4) * arc_span
+        # Quantum zone: 2 → 2√2 (purple)
+        q_start = s_to_angle(CLASSICAL_BOUND)
+        q_span = -((TSIRELSON_BOUND - CLASSICAL_BOUND) / NO_SIGNALLING_BOUND) * arc_span
         quantum_arc = Arc(radius=radius, start_angle=q_start, angle=q_span,
                           color="#aa44ff", stroke_width=16,
                           stroke_opacity=0.6, arc_center=center)
 
-        # Forbidden zone: 2+√2 → 4 (red, dimmer)
-        f_start = s_to_angle(2 * np.sqrt(2))
-        f_span = -((4 - (2 * np.sqrt(2))) / 4) * arc_span
+        # Forbidden zone: 2√2 → 4 (red, dimmer)
+        f_start = s_to_angle(TSIRELSON_BOUND)
+        f_span = -((NO_SIGNALLING_BOUND - TSIRELSON_BOUND) / NO_SIGNALLING_BOUND) * arc_span
         forbidden_arc = Arc(radius=radius, start_angle=f_start, angle=f_span,
                             color="#ff4444", stroke_width=16,
                             stroke_opacity=0.3, arc_center=center)
@@ -58,9 +62,9 @@ class TsirelsonGauge(Scene):
         ticks = VGroup()
         tick_data = [
             (0, "0", GREY_B),
-            (2, "2", "#44aaff"),
-            (2 * np.sqrt(2), r"2\sqrt{2}", "#aa44ff"),
-            (4, "4", "#ff4444"),
+            (CLASSICAL_BOUND, f"{CLASSICAL_BOUND:g}", "#44aaff"),
+            (TSIRELSON_BOUND, r"2\sqrt{2}", "#aa44ff"),
+            (NO_SIGNALLING_BOUND, f"{NO_SIGNALLING_BOUND:g}", "#ff4444"),
         ]
         for s_val, label_str, col in tick_data:
             angle = s_to_angle(s_val)
@@ -100,9 +104,10 @@ class TsirelsonGauge(Scene):
 
         # ── Side annotations ──
         bounds_text = VGroup(
-            MathTex(r"\text{Classical: } S \leq 2", font_size=24, color="#44aaff"),
+            MathTex(rf"\text{{Classical: }} S \leq {CLASSICAL_BOUND:g}", font_size=24, color="#44aaff"),
             MathTex(r"\text{Tsirelson: } S \leq 2\sqrt{2}", font_size=24, color="#aa44ff"),
-            MathTex(r"\text{No-Signaling: } S \leq 4", font_size=24, color="#ff4444"),
+            MathTex(rf"\text{{No-Signaling: }} S \leq {NO_SIGNALLING_BOUND:g}", font_size=24,
+                    color="#ff4444"),
         ).arrange(DOWN, aligned_edge=LEFT, buff=0.2).to_edge(RIGHT, buff=0.5).shift(DOWN*0.5)
 
         tsirelson_def = MathTex(
@@ -126,16 +131,17 @@ class TsirelsonGauge(Scene):
         self.play(FadeIn(s_display), run_time=0.4)
 
         # Sweep needle to Classical limit (S=2)
-        n2 = get_needle(2)
-        s2_tex = MathTex(r"S = 2.00", font_size=40, color="#44aaff"
+        n2 = get_needle(CLASSICAL_BOUND)
+        s2_tex = MathTex(f"S = {CLASSICAL_BOUND:.2f}", font_size=40, color="#44aaff"
                          ).next_to(center, DOWN, buff=0.8)
         self.play(Transform(init_needle, n2), Transform(s_display, s2_tex), run_time=1.5)
         self.play(Flash(needle_dot, color="#44aaff", flash_radius=0.3), run_time=0.5)
         self.wait(0.3)
 
         # Sweep to Tsirelson (S=2√2)
-        n_ts = get_needle(2 * np.sqrt(2))
-        s_ts_tex = MathTex(r"S = 2\sqrt{2} \approx 2.83", font_size=40, color="#aa44ff"
+        n_ts = get_needle(TSIRELSON_BOUND)
+        s_ts_tex = MathTex(rf"S = 2\sqrt{{2}} \approx {TSIRELSON_BOUND:.2f}", font_size=40,
+                           color="#aa44ff"
                            ).next_to(center, DOWN, buff=0.8)
         self.play(Transform(init_needle, n_ts), Transform(s_display, s_ts_tex), run_time=1.5)
         self.play(Flash(needle_dot, color="#aa44ff", flash_radius=0.4), run_time=0.5)
@@ -145,15 +151,20 @@ class TsirelsonGauge(Scene):
         self.wait(0.3)
 
         # Try to push into forbidden zone → bounces back
-        n4 = get_needle(3.5)
-        s4_tex = MathTex(r"S = 3.50", font_size=40, color="#ff4444"
+        s_push = 3.5
+        n4 = get_needle(s_push)
+        s4_tex = MathTex(f"S = {s_push:.2f}", font_size=40, color="#ff4444"
                          ).next_to(center, DOWN, buff=0.8)
+        # noisy PR boxes with this S have bias E = S/4 in the nested IC protocol
+        ic_push = MathTex(rf"I = {information(s_push / 4, DECK_DEPTH):.0f} > 1"
+                          rf"\quad (N = {2 ** DECK_DEPTH})", font_size=24, color="#ff4444"
+                          ).next_to(s4_tex, DOWN, buff=0.2)
         self.play(Transform(init_needle, n4), Transform(s_display, s4_tex),
-                  run_time=0.8, rate_func=rush_into)
+                  FadeIn(ic_push), run_time=0.8, rate_func=rush_into)
 
         # Bounce back!
         self.play(Transform(init_needle, n_ts.copy()), Transform(s_display, s_ts_tex.copy()),
-                  run_time=0.6, rate_func=rush_from)
+                  FadeOut(ic_push), run_time=0.6, rate_func=rush_from)
         self.play(Wiggle(init_needle, scale_value=1.05, rotation_angle=0.03), run_time=0.6)
 
         self.play(FadeIn(bounds_text, shift=LEFT*0.3), run_time=1)
@@ -225,9 +236,11 @@ class PRBoxCrime(Scene):
         # ── S counter (right side) ──
         s_counter_title = Text("CHSH Score", font_size=22, color=WHITE,
                                weight=BOLD).shift(RIGHT*4 + UP*1.5)
+        # running S after each row: the PR box scores +1 on every input pair
+        running = np.concatenate([[0.0], np.cumsum(chsh_terms(pr_box())[0])])
         s_values = []
-        for i in range(5):
-            s_val = MathTex(f"S = {i}", font_size=36,
+        for i, s in enumerate(running):
+            s_val = MathTex(f"S = {s:g}", font_size=36,
                             color=GREEN if i < 4 else YELLOW
                             ).shift(RIGHT*4 + UP*0.6)
             s_values.append(s_val)
@@ -247,7 +260,7 @@ class PRBoxCrime(Scene):
         self.wait(0.3)
 
         # ── S = 4 highlight ──
-        s_final = MathTex(r"S = 4", font_size=48, color=YELLOW
+        s_final = MathTex(f"S = {running[-1]:g}", font_size=48, color=YELLOW
                           ).shift(RIGHT*4 + UP*0.6)
         self.play(Transform(s_values[0], s_final), run_time=0.5)
         self.play(Circumscribe(s_final, color=YELLOW, buff=0.15), run_time=0.8)
@@ -255,9 +268,9 @@ class PRBoxCrime(Scene):
         # ── Comparison bars (bottom) ──
         bar_group = VGroup()
         bar_data = [
-            ("Classical", 2, "#44aaff"),
-            ("Tsirelson", 2 * np.sqrt(2), "#aa44ff"),
-            ("PR-Box", 4, "#ff4444"),
+            ("Classical", CLASSICAL_BOUND, "#44aaff"),
+            ("Tsirelson", TSIRELSON_BOUND, "#aa44ff"),
+            ("PR-Box", NO_SIGNALLING_BOUND, "#ff4444"),
         ]
         bar_width = 1.0
         max_w = 5.5
@@ -266,19 +279,20 @@ class PRBoxCrime(Scene):
 
         for i, (name, val, col) in enumerate(bar_data):
             y = base_y - i * 0.7
-            w = (val / 4) * max_w
+            w = (val / NO_SIGNALLING_BOUND) * max_w
             bar = Rectangle(width=w, height=0.4, color=col, fill_color=col,
                             fill_opacity=0.5, stroke_width=2)
             bar.move_to([base_x + w/2, y, 0])
             lbl = Text(name, font_size=16, color=col).next_to(bar, LEFT, buff=0.15)
-            val_lbl = MathTex(f"S={val:.2f}" if val != 4 else "S=4", font_size=18,
+            val_lbl = MathTex(f"S={val:.2f}" if val != NO_SIGNALLING_BOUND else f"S={val:g}",
+                              font_size=18,
                               color=WHITE).next_to(bar, RIGHT, buff=0.15)
             bar_group.add(VGroup(bar, lbl, val_lbl))
 
         self.play(LaggedStartMap(FadeIn, bar_group, lag_ratio=0.3), run_time=1.5)
 
         # Tsirelson line
-        ts_x = base_x + ((2 * np.sqrt(2))/4)*max_w
+        ts_x = base_x + (TSIRELSON_BOUND / NO_SIGNALLING_BOUND) * max_w
         ts_line = DashedLine([ts_x, base_y + 0.4, 0], [ts_x, base_y - 1.8, 0],
                              color=YELLOW, stroke_width=2, dash_length=0.1)
         ts_lbl = Text("Tsirelson", font_size=14, color=YELLOW
@@ -410,19 +424,25 @@ class ICGame(Scene):
         self.wait(0.3)
 
         # ── Verdict panel (right edge) ──
+        # Nested protocol with N = 2^DECK_DEPTH bits and m = 1: bias 1/√2 at
+        # Tsirelson's bound, bias 1 for the PR box
+        i_qm = information(TSIRELSON_BOUND / 4, DECK_DEPTH)
+        i_pr = information(NO_SIGNALLING_BOUND / 4, DECK_DEPTH)
         verdict_qm = VGroup(
             Text("Quantum:", font_size=18, color="#aa44ff", weight=BOLD),
-            MathTex(r"I \leq m", font_size=22, color=GREEN),
+            MathTex(rf"I \approx {i_qm:.2f} \leq 1", font_size=22, color=GREEN),
             Text("  PASS", font_size=16, color=GREEN, weight=BOLD),
         ).arrange(RIGHT, buff=0.2).shift(RIGHT*4 + DOWN*1.5)
 
         verdict_pr = VGroup(
             Text("PR-Box:", font_size=18, color="#ff4444", weight=BOLD),
-            MathTex(r"I > m", font_size=22, color="#ff4444"),
+            MathTex(rf"I = {i_pr:.0f} > 1", font_size=22, color="#ff4444"),
             Text("  FAIL", font_size=16, color="#ff4444", weight=BOLD),
         ).arrange(RIGHT, buff=0.2).next_to(verdict_qm, DOWN, buff=0.25)
+        verdict_note = Text(f"N = {2 ** DECK_DEPTH} bits, m = 1", font_size=14, color=GREY_B
+                            ).next_to(verdict_qm, UP, buff=0.2)
 
-        self.play(FadeIn(verdict_qm, shift=LEFT*0.3), run_time=0.8)
+        self.play(FadeIn(verdict_note), FadeIn(verdict_qm, shift=LEFT*0.3), run_time=0.8)
         self.play(FadeIn(verdict_pr, shift=LEFT*0.3), run_time=0.8)
         self.play(Indicate(verdict_pr, color="#ff4444", scale_factor=1.05), run_time=0.8)
 
@@ -0,0 +1,233 @@
+"""
+Rendering benchmark with per-scene regression thresholds.
+
+Renders a fixed set of scenes (at least one from each of the five modules)
+at -ql and -qh, each in a fresh process, and records wall time, frames per
+second, output size and peak RSS. Every run is appended to
+benchmarks/history.jsonl; the new numbers are compared with the median of
+the previous runs on the same host and manim version, and anything worse
+than the scene's threshold is flagged (exit status 1).
+
+Thresholds come from benchmarks/thresholds.json, keyed by "<Scene>@q<x>"
+or "<Scene>": a number applies to every metric, an object to the metrics
+it names. Scenes without an entry use --threshold.
+
+Runs fully offline on CPU. Partial-movie caching is disabled so each
+measurement is a real render; typesetting uses the shared SVG cache, so a
+cold cache only affects the first run. No profiling hooks are installed:
+frames are counted from the finished movie (ffprobe), and manim and the
+scene module are imported before the clock starts, so the wall time is
+that of a plain render.
+
+Run:
+  python render_bench.py                    # whole suite, -ql and -qh
+  python render_bench.py -q l --repeat 3    # drafts only, median of 3
+  python render_bench.py --threshold 0.05 --history 10   # stricter default threshold
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import render_deck
+
+HISTORY_PATH = render_deck.ROOT / "benchmarks" / "history.jsonl"
+THRESHOLDS_PATH = render_deck.ROOT / "benchmarks" / "thresholds.json"
+# Bumped when what is measured changes; only runs of the same version form a baseline.
+# 2: wall time without render_profile's hooks.
+# 3: wall time without importing manim and the scene module.
+BENCH_VERSION = 3
+
+BENCH_SCENES = (
+    "PRBoxScene",        # manim_scenes
+    "CHSHBarsV2",        # manim_scenes_extra
+    "TsirelsonGauge",    # manim_speaker2
+    "ICGame",            # manim_speaker2 (long)
+    "BigPicture",        # manim_speaker3
+    "Lemma5Visual",      # manim_lemmas
+)
+
+# metric → +1 if larger is worse, -1 if smaller is worse
+METRICS = {"wall": +1, "fps": -1, "size_bytes": +1, "peak_rss_mb": +1}
+
+
+def count_frames(movie):
+    out = subprocess.run(["ffprobe", "-v", "error", "-select_streams", "v:0", "-count_packets",
+                          "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", str(movie)],
+                         capture_output=True, text=True, check=True)
+    return int(out.stdout.strip())
+
+
+def _run_child(scene, quality):
+    """Render one scene (inside the benchmark subprocess) and return its metrics."""
+    job = render_deck.select_jobs(render_deck.discover_scenes(), [scene])[0]
+    # import manim and the scene module outside the timed window
+    import importlib
+
+    import manim  # noqa: F401
+
+    importlib.import_module(job.module)
+    start = time.perf_counter()
+    movie = render_deck.render_scene(job, quality, disable_caching=True,
+                                     media_dir=str(render_deck.MEDIA_DIR / "bench"))
+    wall = time.perf_counter() - start
+    frames = count_frames(movie)
+    return {
+        "wall": round(wall, 3),
+        "fps": round(frames / wall, 2) if wall else 0.0,
+        "frames": frames,
+        "size_bytes": os.path.getsize(movie),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def measure(scene, quality, repeat=1):
+    """Median metrics over `repeat` fresh-process renders."""
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", scene, quality],
+            cwd=render_deck.ROOT, capture_output=True, text=True,
+        )
+        if out.returncode != 0:
+            raise RuntimeError(f"{scene} -q{quality} failed:\n{out.stderr[-2000:]}")
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {k: statistics.median(r[k] for r in runs) for k in runs[0]}
+
+
+# ─────────────────────────────────────────────────────────
+# History and regression check
+# ─────────────────────────────────────────────────────────
+def host_id():
+    return f"{platform.node()}/{platform.machine()}/{os.cpu_count()}cpu"
+
+
+def git_commit():
+    out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=render_deck.ROOT,
+                         capture_output=True, text=True)
+    return out.stdout.strip() or None
+
+
+def load_history(path=HISTORY_PATH):
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def append_history(run, path=HISTORY_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(run, sort_keys=True) + "\n")
+
+
+def load_thresholds(path=THRESHOLDS_PATH):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def threshold_for(thresholds, key, metric, default):
+    """Threshold of one metric of "<Scene>@q<x>": the key's entry, then the scene's, then default."""
+    for name in (key, key.split("@", 1)[0]):
+        entry = thresholds.get(name)
+        if isinstance(entry, dict):
+            if metric in entry:
+                return entry[metric]
+        elif entry is not None:
+            return entry
+    return default
+
+
+def baseline(history, key, host, manim, window):
+    """Median of each metric over the last `window` comparable runs."""
+    past = [run["results"][key] for run in history
+            if run["host"] == host and run["manim"] == manim
+            and run.get("bench", 1) == BENCH_VERSION and key in run["results"]]
+    past = past[-window:]
+    if not past:
+        return None
+    return {m: statistics.median(p[m] for p in past) for m in METRICS}
+
+
+def regressions(results, history, host, manim, threshold, window, thresholds=None):
+    """Yield (key, metric, old, new, change) for metrics worse than their threshold."""
+    thresholds = thresholds or {}
+    for key, new in results.items():
+        base = baseline(history, key, host, manim, window)
+        if not base:
+            continue
+        for metric, direction in METRICS.items():
+            old = base[metric]
+            if not old:
+                continue
+            change = (new[metric] - old) / old
+            if direction * change > threshold_for(thresholds, key, metric, threshold):
+                yield key, metric, old, new[metric], change
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene rendering.")
+    parser.add_argument("--child", nargs=2, metavar=("SCENE", "QUALITY"), help=argparse.SUPPRESS)
+    parser.add_argument("scenes", nargs="*", help=f"default: {', '.join(BENCH_SCENES)}")
+    parser.add_argument("-q", "--quality", action="append", choices=sorted(render_deck.QUALITIES),
+                        help="repeatable (default: l and h)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative change that counts as a regression for scenes "
+                             "without an entry in benchmarks/thresholds.json (default 0.10)")
+    parser.add_argument("--history", type=int, default=5,
+                        help="number of previous runs in the baseline median")
+    parser.add_argument("--no-record", action="store_true", help="do not append to the history")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_run_child(*args.child)))
+        return 0
+
+    scenes = args.scenes or list(BENCH_SCENES)
+    qualities = args.quality or ["l", "h"]
+    manim = render_deck.manim_version()
+    host = host_id()
+
+    results = {}
+    for quality in qualities:
+        for scene in scenes:
+            key = f"{scene}@q{quality}"
+            results[key] = measure(scene, quality, args.repeat)
+            r = results[key]
+            print(f"{key:<24} {r['wall']:7.2f}s  {r['fps']:7.1f} fps  "
+                  f"{r['size_bytes'] / 1024:8.0f} KiB  {r['peak_rss_mb']:6.0f} MB")
+
+    history = load_history()
+    thresholds = load_thresholds()
+    flagged = list(regressions(results, history, host, manim, args.threshold, args.history,
+                               thresholds))
+    for key, metric, old, new, change in flagged:
+        limit = threshold_for(thresholds, key, metric, args.threshold)
+        print(f"REGRESSION {key} {metric}: {old:g} → {new:g} ({change:+.1%}, limit {limit:.0%})")
+    if not flagged:
+        print(f"No regressions beyond the per-scene thresholds (default {args.threshold:.0%})")
+
+    if not args.no_record:
+        append_history({
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "bench": BENCH_VERSION,
+            "host": host,
+            "manim": manim,
+            "results": results,
+        })
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Persistent SVG cache shared by every render of the deck.
+
+manim keeps typeset Text/MathTex SVGs under each media dir, so parallel
+workers, different -q levels and the five scene modules each typeset the
+same strings again. This cache is content-addressed and lives outside the
+media dirs (default ~/.cache/tsirelson-deck/svg, or $TSIRELSON_SVG_CACHE):
+
+  tex-<hash>   hash of the complete .tex source (template + environment + string)
+  text-<hash>  manim's Text hash (text, font, weight, slant, size, ...) + manimpango version
+
+Objects are published with an atomic rename, so concurrent writers never
+expose a partial file; the last writer of an identical object simply wins.
+The cache is capped in size and evicts least-recently-used objects.
+
+Run:
+  python render_cache.py stats      # hit/miss counters and size
+  python render_cache.py prune      # evict down to the size cap now
+  python render_cache.py clear
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_ROOT = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "tsirelson-deck" / "svg"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_root():
+    return Path(os.environ.get("TSIRELSON_SVG_CACHE", DEFAULT_ROOT))
+
+
+class SvgCache:
+    """Content-addressed, size-capped store of typeset SVG files."""
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root else default_root()
+        self.objects = self.root / "objects"
+        self.max_bytes = max_bytes
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self._pending = {}   # kind → [hits, misses] not yet written to stats.json
+
+    def _path(self, key):
+        return self.objects / key[-2:] / f"{key}.svg"
+
+    @contextmanager
+    def _locked(self):
+        with open(self.root / ".lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _count(self, key, hit):
+        kind = key.split("-", 1)[0]
+        self._pending.setdefault(kind, [0, 0])[0 if hit else 1] += 1
+
+    # ── lookups ──
+    def fetch(self, key, dest):
+        """Materialise the object for key at dest. Returns True on a hit."""
+        src = self._path(key)
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.utime(src)   # LRU: mtime is the last-use time
+            try:
+                os.link(src, dest)
+            except FileExistsError:
+                pass
+            except OSError:
+                shutil.copyfile(src, dest)
+        except FileNotFoundError:
+            self._count(key, hit=False)
+            return False
+        self._count(key, hit=True)
+        return True
+
+    def store(self, key, src):
+        """Publish src under key (atomic rename)."""
+        dest = self._path(key)
+        if dest.exists():
+            return
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out, open(src, "rb") as inp:
+                shutil.copyfileobj(inp, out)
+            os.replace(tmp, dest)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    # ── maintenance ──
+    def flush_stats(self):
+        """Add this process's hit/miss counts to stats.json and enforce the cap."""
+        if not self._pending:
+            return
+        with self._locked():
+            stats = self.read_stats()
+            for kind, (hits, misses) in self._pending.items():
+                entry = stats.setdefault(kind, {"hits": 0, "misses": 0})
+                entry["hits"] += hits
+                entry["misses"] += misses
+            tmp = self.root / "stats.json.part"
+            tmp.write_text(json.dumps(stats, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, self.root / "stats.json")
+            self._pending = {}
+            self._evict()
+
+    def read_stats(self):
+        try:
+            return json.loads((self.root / "stats.json").read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def _entries(self):
+        for path in self.objects.glob("*/*.svg"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            yield st.st_mtime, st.st_size, path
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        target = int(self.max_bytes * 0.9)   # leave headroom so we do not evict on every flush
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def prune(self):
+        with self._locked():
+            return self._evict()
+
+    def clear(self):
+        with self._locked():
+            shutil.rmtree(self.objects, ignore_errors=True)
+            (self.root / "stats.json").unlink(missing_ok=True)
+            self.objects.mkdir(parents=True, exist_ok=True)
+
+
+# ─────────────────────────────────────────────────────────
+# manim integration
+# ─────────────────────────────────────────────────────────
+def tex_key(tex_file):
+    """tex_file is manim's generated .tex, whose stem hashes the full source."""
+    return f"tex-{Path(tex_file).stem}"
+
+
+def install(cache):
+    """Route manim's Tex and Text typesetting through the cache (idempotent)."""
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.mobject.text.text_mobject as text_mobject
+    import manimpango
+    from manim import config
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    if getattr(tex_mobject.tex_to_svg_file, "_svg_cache", None) is not None:
+        tex_mobject.tex_to_svg_file._svg_cache = cache
+        return
+
+    tex_to_svg_file = tex_mobject.tex_to_svg_file
+
+    def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+        template = tex_template or config["tex_template"]
+        tex_file = generate_tex_file(expression, environment, template)
+        svg = tex_file.with_suffix(".svg")
+        active = cached_tex_to_svg_file._svg_cache
+        if svg.exists() or active.fetch(tex_key(tex_file), svg):
+            return svg
+        result = tex_to_svg_file(expression, environment, template)
+        active.store(tex_key(tex_file), result)
+        return result
+
+    cached_tex_to_svg_file._svg_cache = cache
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+    pango = manimpango.__version__
+
+    def wrap_text2svg(cls):
+        text2svg = cls._text2svg
+
+        def cached_text2svg(self, *args):
+            text_hash = self._text2hash(*args)
+            key = f"text-{text_hash}-{pango}"
+            svg = Path(config.get_dir("text_dir")) / f"{text_hash}.svg"
+            active = tex_mobject.tex_to_svg_file._svg_cache
+            if svg.exists() or active.fetch(key, svg):
+                return str(svg.resolve())
+            result = text2svg(self, *args)
+            active.store(key, result)
+            return result
+
+        cls._text2svg = cached_text2svg
+
+    for cls in (text_mobject.Text, text_mobject.MarkupText):
+        wrap_text2svg(cls)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect the shared SVG cache.")
+    parser.add_argument("command", choices=["stats", "prune", "clear"])
+    parser.add_argument("--root", type=Path, default=None)
+    parser.add_argument("--max-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024))
+    args = parser.parse_args(argv)
+
+    cache = SvgCache(args.root, args.max_mb * 1024 * 1024)
+    if args.command == "stats":
+        stats = cache.read_stats()
+        print(f"{cache.root}  {cache.size() / 1e6:.1f} MB / {cache.max_bytes / 1e6:.0f} MB")
+        for kind, entry in sorted(stats.items()):
+            total = entry["hits"] + entry["misses"]
+            rate = entry["hits"] / total if total else 0.0
+            print(f"  {kind:<5} {entry['hits']:>7} hits  {entry['misses']:>7} misses  ({rate:.0%})")
+    elif args.command == "prune":
+        print(f"Evicted {cache.prune()} object(s)")
+    else:
+        cache.clear()
+        print(f"Cleared {cache.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Warm render server: imports manim and the five scene modules once, then
+renders scenes on request, so a -ql preview costs only the render itself.
+The scene modules and the repo modules they import (bell_chsh, ...; see
+render_deck.local_dependencies) are watched: when a file changed since the
+last request, it and every watched module importing it are re-imported,
+dependencies first, so names bound by `from bell_chsh import ...` are fresh.
+
+Protocol: one JSON object per line, one JSON reply per line.
+  {"cmd": "render", "scene": "PRBoxScene", "quality": "l"}
+  {"cmd": "render", "scene": "ICGame", "quality": "h", "assets": true}
+  {"cmd": "render", "scene": "TsirelsonGauge", "animations": [12, 15]}
+  {"cmd": "render", "scene": "PRBoxCrime", "seconds": [20.0, 26.5]}
+  {"cmd": "ping"} | {"cmd": "shutdown"}
+Scenes are those render_deck.py would render: a superseded definition
+(CHSHBars, replaced by CHSHBarsV2) is an unknown scene. With --stdio,
+stdout carries only the replies; logs and warnings go to stderr.
+
+Run:
+  python render_daemon.py serve                 # listen on media/render.sock
+  python render_daemon.py serve --stdio         # same protocol on stdin/stdout
+  python render_daemon.py render PRBoxScene     # client: -ql preview via the server
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+import render_deck
+import render_partial
+import render_timeline
+
+SOCKET_PATH = render_deck.MEDIA_DIR / "render.sock"
+
+
+class RenderService:
+    """Keeps the scene modules imported and tracks the mtimes of everything they import."""
+
+    def __init__(self, modules=render_deck.SCENE_MODULES):
+        start = time.perf_counter()
+        import manim  # noqa: F401  (the expensive import, paid once)
+
+        self.modules = modules
+        for name in modules:
+            importlib.import_module(name)
+        self.deps = {}
+        self.mtimes = {}
+        self._refresh_watch()
+        self.jobs = {}
+        self._refresh_jobs()
+        print(f"Render server warm in {time.perf_counter() - start:.1f}s "
+              f"({len(self.jobs)} scenes)", file=sys.stderr)
+
+    @staticmethod
+    def _mtime(name):
+        return os.stat(render_deck.ROOT / f"{name}.py").st_mtime_ns
+
+    def _refresh_watch(self):
+        """{watched module: its local dependencies}: the scene modules and all they import."""
+        self.deps = {}
+        pending = list(self.modules)
+        while pending:
+            name = pending.pop()
+            if name not in self.deps:
+                self.deps[name] = render_deck.local_dependencies(name)
+                pending.extend(self.deps[name])
+        self.mtimes = {name: self._mtime(name) for name in self.deps}
+
+    def _refresh_jobs(self):
+        # superseded scenes are left out: their asset belongs to the newer one
+        jobs, _, _ = render_deck.resolve_targets(render_deck.discover_scenes(self.modules))
+        self.jobs = {job.scene: job for job in jobs}
+
+    def reload_changed(self):
+        """
+        Re-import modules whose file changed, and the watched modules that
+        import them. Returns the re-imported names in reload order.
+        """
+        changed = {n for n in self.deps if self._mtime(n) != self.mtimes[n]}
+        if not changed:
+            return []
+        stale = [n for n, deps in self.deps.items() if n in changed or deps & changed]
+        # a module's dependencies are a strict subset of its dependents' ones
+        stale.sort(key=lambda n: len(self.deps[n]))
+        for name in stale:
+            if name in sys.modules:
+                importlib.reload(sys.modules[name])
+            else:
+                importlib.import_module(name)
+        self._refresh_watch()          # an edit may add or drop imports
+        self._refresh_jobs()
+        return stale
+
+    def handle(self, request):
+        cmd = request.get("cmd")
+        if cmd == "ping":
+            return {"ok": True}
+        if cmd != "render":
+            return {"ok": False, "error": f"unknown command {cmd!r}"}
+
+        reloaded = self.reload_changed()
+        job = self.jobs.get(request.get("scene"))
+        if job is None:
+            return {"ok": False, "error": f"unknown scene {request.get('scene')!r}"}
+        quality = request.get("quality", "l")
+        if quality not in render_deck.QUALITIES:
+            return {"ok": False, "error": f"unknown quality {quality!r}"}
+
+        animations, seconds = request.get("animations"), request.get("seconds")
+        start = time.perf_counter()
+        try:
+            if animations or seconds:
+                output, window, offset = render_partial.render_window(
+                    job, quality, animations=animations and tuple(animations),
+                    seconds=seconds and tuple(seconds))
+                return {"ok": True, "scene": job.scene, "output": str(output),
+                        "animations": window, "offset": offset,
+                        "seconds": round(time.perf_counter() - start, 3), "reloaded": reloaded}
+            with render_timeline.record_segments() as segments:
+                movie = render_deck.render_scene(job, quality)
+        except Exception as exc:
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}", "reloaded": reloaded}
+        output = movie
+        if request.get("assets"):
+            key = render_deck.build_key(job, quality, render_deck.manim_version())
+            output = render_deck.publish_asset(job, movie, segments, render_deck.load_manifest(), key)
+            render_deck.rebuild_sprite()
+        return {"ok": True, "scene": job.scene, "output": str(output),
+                "seconds": round(time.perf_counter() - start, 3), "reloaded": reloaded}
+
+
+# ─────────────────────────────────────────────────────────
+# Transports
+# ─────────────────────────────────────────────────────────
+def _serve_lines(service, rfile, wfile):
+    """Answer requests from rfile until EOF. Returns False after a shutdown request."""
+    for line in rfile:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            reply = {"ok": False, "error": f"bad request: {exc}"}
+        else:
+            if request.get("cmd") == "shutdown":
+                wfile.write(b'{"ok": true}\n')
+                wfile.flush()
+                return False
+            reply = service.handle(request)
+        wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+        wfile.flush()
+    return True
+
+
+def serve_socket(service, path=SOCKET_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            if not _serve_lines(service, self.rfile, self.wfile):
+                self.server.stop = True
+
+    # Single-threaded on purpose: manim's config is process-global.
+    with socketserver.UnixStreamServer(str(path), Handler) as server:
+        server.stop = False
+        print(f"Listening on {path}", file=sys.stderr)
+        try:
+            while not server.stop:
+                server.handle_request()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def serve_stdio(service):
+    # stdout carries the JSON replies only; manim's log and our progress go to stderr
+    replies = sys.stdout.buffer
+    with contextlib.redirect_stdout(sys.stderr):
+        _serve_lines(service, sys.stdin.buffer, replies)
+
+
+def request(payload, path=SOCKET_PATH):
+    """Send one request to a running server and return its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as reply:
+            return json.loads(reply.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm manim render server.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve")
+    serve.add_argument("--stdio", action="store_true")
+    serve.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    client = sub.add_parser("render")
+    client.add_argument("scene")
+    client.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="l")
+    client.add_argument("--assets", action="store_true",
+                        help="also publish into assets/ (chapters, poster, manifest)")
+    client.add_argument("--animations", type=render_partial.parse_animations)
+    client.add_argument("--seconds", type=lambda t: render_partial.parse_range(t, float))
+    client.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    stop = sub.add_parser("shutdown")
+    stop.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        service = RenderService()
+        if args.stdio:
+            serve_stdio(service)
+        else:
+            serve_socket(service, args.socket)
+        return 0
+    if args.command == "shutdown":
+        print(json.dumps(request({"cmd": "shutdown"}, args.socket)))
+        return 0
+
+    reply = request({"cmd": "render", "scene": args.scene, "quality": args.quality,
+                     "assets": args.assets, "animations": args.animations,
+                     "seconds": args.seconds}, args.socket)
+    if reply.get("ok"):
+        note = f"  (reloaded {', '.join(reply['reloaded'])})" if reply.get("reloaded") else ""
+        print(f"{reply['scene']} → {reply['output']}  ({reply['seconds']:.1f}s){note}")
+        return 0
+    print(f"error: {reply.get('error')}", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
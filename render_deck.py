@@ -0,0 +1,465 @@
+"""
+Render every Manim scene of the deck into assets/*.webm in parallel.
+Scenes are discovered in the five manim_*.py modules and mapped to their
+target file via the "→ assets/<name>.webm" banner above each class.
+
+Run:
+  python render_deck.py                      # all scenes, -qh, one worker per core
+  python render_deck.py -q l ICGame DPIChain # selected scenes, draft quality
+  python render_deck.py --list               # show the scene → asset map
+  python render_deck.py --referenced         # only scenes the decks link to (render_deps.py)
+  python render_deck.py --force              # ignore the build manifest
+  python render_deck.py --transparent        # VP9 + alpha for both deck themes
+  python render_deck.py --vfr                # holds encoded once (render_vfr.py)
+
+Scenes whose source, module imports, manim version and quality flags hash to
+the value recorded in assets/render-manifest.json are skipped.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+ASSETS_DIR = ROOT / "assets"
+MEDIA_DIR = ROOT / "media"
+MANIFEST_PATH = ASSETS_DIR / "render-manifest.json"
+PREPASS_TEX_DIR = MEDIA_DIR / "Tex"   # scratch dir of the batched pre-pass (render_tex.py)
+
+SCENE_MODULES = (
+    "manim_scenes",
+    "manim_scenes_extra",
+    "manim_speaker2",
+    "manim_speaker3",
+    "manim_lemmas",
+)
+
+# manim -q<flag>  →  config.quality
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+TARGET_RE = re.compile(r"→\s*(?:assets/)?(\S+\.webm)")
+
+# ffmpeg and Pillow are optional: a poster or sprite that cannot be cut is
+# reported, but never fails a render that already reached assets/.
+POSTER_ERRORS = (ImportError, OSError, subprocess.CalledProcessError)
+
+
+@dataclass(frozen=True)
+class SceneJob:
+    module: str
+    scene: str
+    target: str      # file name inside assets/, e.g. "1_polytope.webm"
+    lineno: int
+    source_digest: str  # class source + module-level code it runs against
+
+
+# ─────────────────────────────────────────────────────────
+# Discovery (static — does not import manim)
+# ─────────────────────────────────────────────────────────
+def _banner_target(lines, class_lineno):
+    """Return the .webm named in the comment banner right above a class."""
+    i = class_lineno - 2
+    while i >= 0 and lines[i].lstrip().startswith("#"):
+        match = TARGET_RE.search(lines[i])
+        if match:
+            return match.group(1)
+        i -= 1
+    return None
+
+
+def _local_imports(tree, root, seen):
+    """
+    Source of the repo modules tree imports (bell_chsh, ...), transitively.
+    Imports inside a module's main() only serve its CLI and are not followed.
+    """
+    names = []
+    body = [n for n in tree.body if not (isinstance(n, ast.FunctionDef) and n.name == "main")]
+    for node in (sub for top in body for sub in ast.walk(top)):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    parts = []
+    for name in names:
+        path = root / f"{name}.py"
+        if name in seen or not path.exists():
+            continue
+        seen.add(name)
+        source = path.read_text(encoding="utf-8")
+        parts += [source, *_local_imports(ast.parse(source), root, seen)]
+    return parts
+
+
+def local_dependencies(module, root=ROOT):
+    """Names of the repo modules module imports, transitively (as hashed into its build keys)."""
+    seen = set()
+    source = (root / f"{module}.py").read_text(encoding="utf-8")
+    _local_imports(ast.parse(source), root, seen)
+    return seen - {module}
+
+
+def _source_digest(source, tree, node, root=ROOT):
+    """
+    Hash what a scene's output can depend on: the class itself, any local
+    base classes, every module-level statement of its module that is not a
+    class (imports, constants, helpers), and the repo modules it imports.
+    """
+    classes = {n.name: n for n in tree.body if isinstance(n, ast.ClassDef)}
+    parts = [ast.get_source_segment(source, n)
+             for n in tree.body if not isinstance(n, ast.ClassDef)]
+    pending = [node]
+    while pending:
+        cls = pending.pop()
+        parts.append(ast.get_source_segment(source, cls))
+        pending.extend(classes[b.id] for b in cls.bases
+                       if isinstance(b, ast.Name) and b.id in classes)
+    parts += _local_imports(tree, root, set())
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def discover_scenes(modules=SCENE_MODULES, root=ROOT):
+    """List every Scene subclass in the scene modules, in source order."""
+    jobs = []
+    for module in modules:
+        source = (root / f"{module}.py").read_text(encoding="utf-8")
+        lines = source.splitlines()
+        tree = ast.parse(source)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = [b.id for b in node.bases if isinstance(b, ast.Name)]
+            if not any(b.endswith("Scene") for b in bases):
+                continue
+            target = _banner_target(lines, node.lineno)
+            digest = _source_digest(source, tree, node, root)
+            jobs.append(SceneJob(module, node.name, target, node.lineno, digest))
+    return jobs
+
+
+def resolve_targets(jobs):
+    """
+    Keep one scene per asset. When two scenes claim the same file
+    (CHSHBars / CHSHBarsV2 → 4_chsh_bars.webm) the later definition wins,
+    matching the "Updated ..." convention used in the modules.
+    Returns (jobs_to_render, superseded, untargeted).
+    """
+    by_target = {}
+    superseded = []
+    untargeted = []
+    for job in jobs:
+        if job.target is None:
+            untargeted.append(job)
+            continue
+        if job.target in by_target:
+            superseded.append(by_target[job.target])
+        by_target[job.target] = job
+    return list(by_target.values()), superseded, untargeted
+
+
+def select_jobs(jobs, names):
+    if not names:
+        return jobs
+    wanted = set(names)
+    picked = [j for j in jobs if j.scene in wanted or j.target in wanted]
+    unknown = wanted - {j.scene for j in picked} - {j.target for j in picked}
+    if unknown:
+        raise SystemExit(f"Unknown scene(s): {', '.join(sorted(unknown))}")
+    return picked
+
+
+# ─────────────────────────────────────────────────────────
+# Build manifest (incremental rebuilds)
+# ─────────────────────────────────────────────────────────
+def manim_version():
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("manim")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def build_key(job, quality, version, transparent=False, vfr=False):
+    """Content hash identifying one rendered asset."""
+    fmt = "webm-alpha" if transparent else "webm"
+    payload = json.dumps({
+        "source": job.source_digest,
+        "scene": f"{job.module}.{job.scene}",
+        "manim": version,
+        "quality": QUALITIES[quality],
+        "format": f"{fmt}-vfr" if vfr else fmt,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_digest(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    tmp = path.with_suffix(".json.part")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def is_up_to_date(job, key, manifest, assets_dir=ASSETS_DIR):
+    """An asset is fresh if its build key matches and the file was not replaced since."""
+    entry = manifest.get(job.target)
+    asset = assets_dir / job.target
+    if not entry or entry.get("key") != key or not asset.exists():
+        return False
+    return entry.get("sha256") == file_digest(asset)
+
+
+def record_build(manifest, job, key, assets_dir=ASSETS_DIR, alpha=False):
+    manifest[job.target] = {
+        "key": key,
+        "scene": f"{job.module}.{job.scene}",
+        "sha256": file_digest(assets_dir / job.target),
+        "alpha": alpha,          # the deck composites these on its own background
+    }
+
+
+# ─────────────────────────────────────────────────────────
+# Rendering (runs inside a worker process)
+# ─────────────────────────────────────────────────────────
+def manim_config(job, quality, media_dir=MEDIA_DIR):
+    """tempconfig overrides equivalent to `manim -q<quality> --format=webm`."""
+    # TeX/Text scratch dirs are per worker: two processes typesetting the
+    # same string into the same file would race on the .tex/.dvi/.svg writes.
+    # Finished SVGs are shared through render_cache.SvgCache instead.
+    worker_dir = media_dir / "workers" / str(os.getpid())
+    return {
+        "quality": QUALITIES[quality],
+        "format": "webm",
+        "media_dir": str(media_dir),
+        "tex_dir": str(worker_dir / "Tex"),
+        "text_dir": str(worker_dir / "texts"),
+        "output_file": Path(job.target).stem,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+
+
+def render_scene(job, quality, **overrides):
+    """Render one scene in this process and return the movie path (None if no movie was written)."""
+    import importlib
+
+    from manim import tempconfig
+
+    import render_cache
+
+    module = importlib.import_module(job.module)
+    scene_cls = getattr(module, job.scene)
+    cache = render_cache.SvgCache()
+    render_cache.install(cache)
+    try:
+        with tempconfig({**manim_config(job, quality), **overrides}):
+            scene = scene_cls()
+            scene.render()
+            movie = getattr(scene.renderer.file_writer, "movie_file_path", None)
+            return Path(movie) if movie else None
+    finally:
+        cache.flush_stats()
+
+
+def publish_asset(job, movie, segments=None, manifest=None, key=None, alpha=False,
+                  assets_dir=ASSETS_DIR):
+    """
+    Put a finished movie into assets/ with everything derived from it: the
+    webm, its WebVTT chapters (segments recorded during the render, or a
+    dry-run timeline when None) and, when ffmpeg and Pillow are available,
+    its poster. With a manifest the build is recorded under key and saved.
+    Every tool that writes into assets/ goes through here.
+    """
+    import render_timeline
+
+    if segments is None:
+        segments = render_timeline.scene_timeline(job)
+    assets_dir.mkdir(exist_ok=True)
+    target = assets_dir / job.target
+    tmp = target.with_suffix(".webm.part")
+    shutil.copyfile(movie, tmp)
+    os.replace(tmp, target)
+    render_timeline.write_chapters(segments, render_timeline.chapters_path(job, assets_dir))
+    try:
+        import render_posters
+
+        render_posters.write_poster(target, assets_dir / "posters")
+    except POSTER_ERRORS as exc:
+        print(f"  ! {job.scene:<20} no poster ({type(exc).__name__}: {exc})", file=sys.stderr)
+    if manifest is not None:
+        record_build(manifest, job, key, assets_dir, alpha)
+        save_manifest(manifest)
+    return target
+
+
+def rebuild_sprite():
+    """Repack the slide-map sprite after assets changed; failures are only reported."""
+    try:
+        import render_posters
+
+        render_posters.build_sprite()
+    except POSTER_ERRORS as exc:
+        print(f"  ! slide-map sprite not rebuilt ({type(exc).__name__}: {exc})", file=sys.stderr)
+
+
+def render_job(job, quality, profile=False, assets_dir=ASSETS_DIR, transparent=False,
+               vfr=False):
+    """
+    Render one scene and publish it into assets/ (publish_asset; the
+    manifest is updated by the parent). Returns seconds taken.
+
+    transparent renders VP9 with an alpha channel: the scenes'
+    camera.background_color is dropped and the deck composites the video
+    on the theme background instead. vfr encodes through render_vfr.py,
+    so a hold is one frame with a long duration (ignored with profile).
+    """
+    import render_timeline
+
+    overrides = {"transparent": True} if transparent else {}
+    start = time.perf_counter()
+    with render_timeline.record_segments() as segments:
+        if profile:
+            import render_profile
+
+            movie = Path(render_profile.profile_scene(job, quality, **overrides)["movie"])
+        elif vfr:
+            import render_vfr
+
+            movie, _ = render_vfr.render_vfr(job, quality, transparent=transparent)
+        else:
+            movie = render_scene(job, quality, **overrides)
+    publish_asset(job, movie, segments, assets_dir=assets_dir)
+    return time.perf_counter() - start
+
+
+def render_all(jobs, quality="h", workers=None, force=False, tex_prepass=True,
+               profile=False, transparent=False, vfr=False):
+    """
+    Render out-of-date jobs on a process pool and update the manifest.
+    Returns {job: error or None} for the jobs that were rendered.
+    """
+    manifest = load_manifest()
+    version = manim_version()
+    keys = {job: build_key(job, quality, version, transparent, vfr and not profile)
+            for job in jobs}
+    fresh = [] if force else [j for j in jobs if is_up_to_date(j, keys[j], manifest)]
+    for job in fresh:
+        print(f"  = {job.scene:<20} up to date")
+    jobs = [j for j in jobs if j not in fresh]
+    results = {}
+    if not jobs:
+        print("Nothing to render")
+        return results
+
+    if tex_prepass:
+        import render_tex
+        from render_cache import SvgCache
+
+        modules = list(dict.fromkeys(j.module for j in jobs))
+        render_tex.prepass(modules, PREPASS_TEX_DIR, SvgCache())
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    print(f"Rendering {len(jobs)} scene(s) at -q{quality} on {workers} worker(s)")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_job, job, quality, profile, ASSETS_DIR, transparent, vfr): job
+                   for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                seconds = future.result()
+            except Exception as exc:  # keep going, report at the end
+                results[job] = exc
+                print(f"  ✗ {job.scene:<20} {type(exc).__name__}: {exc}")
+            else:
+                results[job] = None
+                record_build(manifest, job, keys[job], alpha=transparent)
+                save_manifest(manifest)
+                print(f"  ✓ {job.scene:<20} → assets/{job.target}  ({seconds:.1f}s)")
+    if any(error is None for error in results.values()):
+        rebuild_sprite()
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+    return results
+
+
+# ─────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────
+def print_scene_map(jobs, superseded, untargeted):
+    for job in jobs:
+        print(f"{job.module + '.' + job.scene:<36} → assets/{job.target}")
+    for job in superseded:
+        print(f"{job.module + '.' + job.scene:<36}   (superseded for {job.target})")
+    for job in untargeted:
+        print(f"{job.module + '.' + job.scene:<36}   (no asset banner)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*",
+                        help="scene class names or asset file names (default: all)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render even if the manifest says the asset is current")
+    parser.add_argument("--no-tex-prepass", action="store_true",
+                        help="skip batch-compiling the TeX strings before rendering")
+    parser.add_argument("--profile", action="store_true",
+                        help="write per-animation profiles to media/profile/")
+    parser.add_argument("--transparent", action="store_true",
+                        help="VP9 with alpha; one render serves the dark and light deck themes")
+    parser.add_argument("--vfr", action="store_true",
+                        help="variable frame rate: encode each hold once (needs PyAV)")
+    parser.add_argument("--referenced", action="store_true",
+                        help="only scenes whose video a deck references")
+    parser.add_argument("--list", action="store_true", help="print the scene map and exit")
+    args = parser.parse_args(argv)
+
+    jobs, superseded, untargeted = resolve_targets(discover_scenes())
+    if args.list:
+        print_scene_map(jobs, superseded, untargeted)
+        return 0
+
+    jobs = select_jobs(jobs, args.scenes)
+    if args.referenced:
+        import render_deps
+
+        jobs = render_deps.referenced_jobs(jobs)
+    results = render_all(jobs, args.quality, args.jobs, args.force,
+                         tex_prepass=not args.no_tex_prepass, profile=args.profile,
+                         transparent=args.transparent, vfr=args.vfr)
+    return 1 if any(results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
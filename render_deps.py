@@ -0,0 +1,85 @@
+"""
+Which scenes do the decks actually use?
+
+Every deck source (build_pages.PAGES) is scanned for assets/<name>.webm
+references, and each one is mapped back to the scene class whose
+"→ assets/<name>.webm" banner claims it. That splits the scenes into the
+ones a release needs and orphans nobody links to, and finds references no
+scene renders. render_deck.py --referenced renders only the used scenes;
+build_site.py ships only the referenced videos.
+
+Run:
+  python render_deps.py                  # used / orphan scenes, missing assets
+  python render_deck.py --referenced     # render only what the decks use
+"""
+
+import argparse
+import re
+import sys
+
+import build_pages
+import render_deck
+
+VIDEO_REF_RE = re.compile(r"""["']assets/([\w.-]+\.webm)["']""")
+
+
+def deck_sources(root=render_deck.ROOT):
+    """{source file: html} for every deck source (presentation.html is generated)."""
+    return {src: (root / src).read_text(encoding="utf-8")
+            for src in dict.fromkeys(build_pages.PAGES.values())}
+
+
+def referenced_videos(decks=None):
+    """{asset file name: ["deck.html:line", ...]} in deck and source order."""
+    refs = {}
+    for name, html in (decks or deck_sources()).items():
+        for m in VIDEO_REF_RE.finditer(html):
+            line = html.count("\n", 0, m.start()) + 1
+            refs.setdefault(m.group(1), []).append(f"{name}:{line}")
+    return refs
+
+
+def analyse(jobs, refs):
+    """
+    Split resolved jobs against refs. Returns (used, orphans, unbuildable)
+    where unbuildable maps referenced assets no scene renders to their refs.
+    """
+    used = [j for j in jobs if j.target in refs]
+    orphans = [j for j in jobs if j.target not in refs]
+    built = {j.target for j in jobs}
+    unbuildable = {t: where for t, where in refs.items() if t not in built}
+    return used, orphans, unbuildable
+
+
+def referenced_jobs(jobs):
+    return analyse(jobs, referenced_videos())[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Map deck video references to scenes.")
+    parser.parse_args(argv)
+
+    jobs, superseded, untargeted = render_deck.resolve_targets(render_deck.discover_scenes())
+    refs = referenced_videos()
+    used, orphans, unbuildable = analyse(jobs, refs)
+
+    print(f"Used ({len(used)} of {len(jobs)} scenes):")
+    for job in used:
+        state = "" if (render_deck.ASSETS_DIR / job.target).exists() else "  (not rendered yet)"
+        print(f"  {job.module + '.' + job.scene:<36} → assets/{job.target:<26} "
+              f"{', '.join(refs[job.target])}{state}")
+    print(f"Orphans ({len(orphans)}, no deck links to them):")
+    for job in orphans:
+        print(f"  {job.module + '.' + job.scene:<36} → assets/{job.target}")
+    for job in superseded + untargeted:
+        print(f"  {job.module + '.' + job.scene:<36}   (never rendered: "
+              f"{'superseded' if job.target else 'no asset banner'})")
+    if unbuildable:
+        print(f"Missing ({len(unbuildable)}, referenced but no scene renders them):")
+        for target, where in unbuildable.items():
+            print(f"  assets/{target:<26} {', '.join(where)}")
+    return 1 if unbuildable else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Encoder tuning: pick the smallest encode of each scene that still looks
+like the lossless render.
+
+The scene is rendered once into a lossless FFV1 source (frames streamed
+straight from manim, see render_ladder.py), then encoded over a grid of
+codec × CRF × speed × keyframe interval. Every encode is scored with SSIM
+and PSNR against the source; the smallest one above the quality floor
+wins. Within one codec/speed/GOP column CRFs are tried from best to worst
+quality and the column stops at the first encode below the floor.
+
+Results go to media/encode/<name>/matrix.json; --apply publishes the
+winner into assets/ (chapters and poster included) and re-records it in
+the build manifest. AV1 webm needs a browser with AV1 decode; use
+--codecs vp9 for older presenter machines.
+
+Run:
+  python render_encode.py s2_dpi_chain.webm
+  python render_encode.py BigPicture --codecs vp9 --ssim-floor 0.99 --apply
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import render_deck
+from render_ladder import render_to_ffmpeg
+
+ENCODE_DIR = render_deck.MEDIA_DIR / "encode"
+
+# codec → (ffmpeg args, CRFs best→worst quality, speed flag, speeds)
+CODECS = {
+    "vp9": (["-c:v", "libvpx-vp9", "-b:v", "0", "-row-mt", "1", "-deadline", "good"],
+            (24, 30, 36, 42), "-cpu-used", (2, 4)),
+    "av1": (["-c:v", "libsvtav1"], (28, 36, 44, 52), "-preset", (6, 8)),
+}
+GOP_SECONDS = (2, 10)
+SSIM_FLOOR = 0.985
+
+
+@dataclass
+class Trial:
+    codec: str
+    crf: int
+    speed: int
+    gop: int             # keyframe interval in frames
+    size: int = 0
+    ssim: float = 0.0
+    psnr: float = 0.0
+    seconds: float = 0.0
+
+    @property
+    def name(self):
+        return f"{self.codec}-crf{self.crf}-s{self.speed}-g{self.gop}"
+
+
+def lossless_command(path):
+    def command(width, height, fps):
+        return ["ffmpeg", "-y", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+                "-i", "-", "-c:v", "ffv1", "-level", "3", "-pix_fmt", "yuv444p", str(path)]
+    return command
+
+
+def render_source(job, quality, out_dir):
+    """Lossless render of job → out_dir/source.mkv."""
+    source = out_dir / "source.mkv"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    render_to_ffmpeg(job, quality, lossless_command(source))
+    return source
+
+
+def frame_rate(video):
+    out = subprocess.run(["ffprobe", "-v", "error", "-select_streams", "v:0",
+                          "-show_entries", "stream=r_frame_rate", "-of", "csv=p=0", str(video)],
+                         capture_output=True, text=True, check=True).stdout.strip()
+    num, _, den = out.partition("/")
+    return float(num) / float(den or 1)
+
+
+def encode(source, trial, out):
+    args, _, speed_flag, _ = CODECS[trial.codec]
+    start = time.perf_counter()
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-i", str(source), *args,
+                    "-crf", str(trial.crf), speed_flag, str(trial.speed), "-g", str(trial.gop),
+                    "-pix_fmt", "yuv420p", "-an", str(out)], check=True)
+    trial.seconds = round(time.perf_counter() - start, 2)
+    trial.size = out.stat().st_size
+
+
+def score(encoded, source):
+    """(SSIM all, PSNR average) of encoded against source."""
+    graph = ("[0:v]format=yuv444p,split[a0][a1];[1:v]format=yuv444p,split[b0][b1];"
+             "[a0][b0]ssim;[a1][b1]psnr")
+    log = subprocess.run(["ffmpeg", "-i", str(encoded), "-i", str(source), "-lavfi", graph,
+                          "-f", "null", "-"], capture_output=True, text=True, check=True).stderr
+    ssim = re.search(r"SSIM .*All:([0-9.]+)", log)
+    psnr = re.search(r"PSNR .*average:([0-9.]+|inf)", log)
+    return float(ssim.group(1)), float(psnr.group(1))
+
+
+def run_matrix(source, out_dir, codecs=tuple(CODECS), ssim_floor=SSIM_FLOOR, psnr_floor=0.0):
+    """Encode source over the grid; return (trials, best trial or None)."""
+    fps = frame_rate(source)
+    trials = []
+    for codec in codecs:
+        _, crfs, _, speeds = CODECS[codec]
+        for speed in speeds:
+            for gop in (round(s * fps) for s in GOP_SECONDS):
+                for crf in crfs:
+                    trial = Trial(codec, crf, speed, gop)
+                    out = out_dir / f"{trial.name}.webm"
+                    encode(source, trial, out)
+                    trial.ssim, trial.psnr = score(out, source)
+                    trials.append(trial)
+                    ok = trial.ssim >= ssim_floor and trial.psnr >= psnr_floor
+                    print(f"  {trial.name:<24} {trial.size / 1024:8.0f} KiB  "
+                          f"SSIM {trial.ssim:.4f}  PSNR {trial.psnr:5.2f}  "
+                          f"{trial.seconds:5.1f}s{'' if ok else '  below floor'}")
+                    if not ok:
+                        break          # higher CRF in this column only gets worse
+    passing = [t for t in trials if t.ssim >= ssim_floor and t.psnr >= psnr_floor]
+    best = min(passing, key=lambda t: t.size) if passing else None
+    return trials, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the smallest good-enough encode per scene.")
+    parser.add_argument("scenes", nargs="+", help="scene class names or asset file names")
+    parser.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="h")
+    parser.add_argument("--codecs", nargs="+", choices=sorted(CODECS), default=list(CODECS))
+    parser.add_argument("--ssim-floor", type=float, default=SSIM_FLOOR)
+    parser.add_argument("--psnr-floor", type=float, default=0.0)
+    parser.add_argument("--reuse-source", action="store_true",
+                        help="keep an existing media/encode/<name>/source.mkv")
+    parser.add_argument("--apply", action="store_true",
+                        help="publish the winner into assets/ and update the build manifest")
+    args = parser.parse_args(argv)
+
+    jobs, _, _ = render_deck.resolve_targets(render_deck.discover_scenes())
+    manifest = render_deck.load_manifest() if args.apply else None
+    applied = False
+    for job in render_deck.select_jobs(jobs, args.scenes):
+        out_dir = ENCODE_DIR / Path(job.target).stem
+        source = out_dir / "source.mkv"
+        if not (args.reuse_source and source.exists()):
+            source = render_source(job, args.quality, out_dir)
+        current = render_deck.ASSETS_DIR / job.target
+        print(f"{job.scene}  (assets/{job.target}: "
+              f"{current.stat().st_size / 1024 if current.exists() else 0:.0f} KiB)")
+
+        trials, best = run_matrix(source, out_dir, args.codecs, args.ssim_floor, args.psnr_floor)
+        (out_dir / "matrix.json").write_text(json.dumps({
+            "scene": job.scene, "ssim_floor": args.ssim_floor, "psnr_floor": args.psnr_floor,
+            "best": best and best.name, "trials": [asdict(t) for t in trials],
+        }, indent=2) + "\n", encoding="utf-8")
+        if best is None:
+            print("  no encode meets the quality floor")
+            continue
+        print(f"  → {best.name}  {best.size / 1024:.0f} KiB")
+        if args.apply:
+            key = render_deck.build_key(job, args.quality, render_deck.manim_version())
+            render_deck.publish_asset(job, out_dir / f"{best.name}.webm", manifest=manifest, key=key)
+            applied = True
+    if applied:
+        render_deck.rebuild_sprite()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Small instrumentation hooks around manim's Scene.play, shared by the
+render tools (profiling, timelines, partial renders).
+
+Scene.wait is implemented as self.play(Wait(...)) in manim, so observing
+Scene.play sees every self.play and self.wait call of a construct().
+"""
+
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@contextmanager
+def patched(owner, name, make_wrapper):
+    """Temporarily replace owner.name with make_wrapper(original)."""
+    original = getattr(owner, name)
+    setattr(owner, name, make_wrapper(original))
+    try:
+        yield original
+    finally:
+        setattr(owner, name, original)
+
+
+@dataclass
+class PlayCall:
+    index: int        # 0-based animation number, as used by manim -n
+    kind: str         # "play" or "wait"
+    label: str        # animation class names, e.g. "Write, FadeIn"
+    line: int         # line in the scene module that issued the call (0 if unknown)
+
+
+def _caller_line(scene):
+    """Line of construct() (or a helper in the same file) that issued the call."""
+    filename = sys.modules[type(scene).__module__].__file__
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename == filename:
+            return frame.f_lineno
+        frame = frame.f_back
+    return 0
+
+
+def describe_play(scene, index, args):
+    from manim import Wait
+
+    animations = [a for a in args if not isinstance(a, dict)]
+    if len(animations) == 1 and isinstance(animations[0], Wait):
+        kind, label = "wait", "Wait"
+    else:
+        kind = "play"
+        label = ", ".join(type(a).__name__ for a in animations) or "play"
+    return PlayCall(index, kind, label, _caller_line(scene))
+
+
+@contextmanager
+def observe_plays(on_start=None, on_end=None):
+    """
+    Call on_start(scene, call) before and on_end(scene, call) after every
+    top-level Scene.play. After the call, scene.duration holds its run time.
+    """
+    from manim import Scene
+
+    depth = [0]
+    counter = [0]
+
+    def make_wrapper(play):
+        def observed_play(scene, *args, **kwargs):
+            if depth[0]:
+                return play(scene, *args, **kwargs)
+            call = describe_play(scene, counter[0], args)
+            counter[0] += 1
+            if on_start:
+                on_start(scene, call)
+            depth[0] += 1
+            try:
+                return play(scene, *args, **kwargs)
+            finally:
+                depth[0] -= 1
+                if on_end:
+                    on_end(scene, call)
+        return observed_play
+
+    with patched(Scene, "play", make_wrapper):
+        yield
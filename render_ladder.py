@@ -0,0 +1,158 @@
+"""
+Single-pass multi-resolution output: one render, several encodes.
+
+The scene is rendered once at the top resolution. Instead of letting manim
+encode, every frame it writes is streamed as raw RGBA into one ffmpeg
+process whose filter graph splits the stream into parallel scale + VP9
+branches (default 1080p projector, 720p GitHub Pages, 480p phones).
+Rasterisation happens once; only the cheap downscale and the encoders run
+per rung.
+
+Run:
+  python render_ladder.py ICGame
+  python render_ladder.py ICGame BigPicture --rungs 1080 720 480 --assets
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import render_deck
+import render_timeline
+from render_hooks import patched
+
+LADDER_DIR = render_deck.MEDIA_DIR / "ladder"
+DEFAULT_RUNGS = (1080, 720, 480)
+VP9_ARGS = ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p", "-b:v", "0", "-crf", "32",
+            "-row-mt", "1", "-deadline", "good", "-cpu-used", "2"]
+
+
+def ladder_command(width, height, fps, outputs):
+    """ffmpeg argv reading raw RGBA on stdin and writing one webm per (rung, path)."""
+    labels = [f"v{i}" for i in range(len(outputs))]
+    graph = [f"[0:v]split={len(outputs)}" + "".join(f"[{l}]" for l in labels)]
+    for label, (rung, _) in zip(labels, outputs):
+        if rung >= height:
+            graph.append(f"[{label}]null[o{label}]")
+        else:
+            graph.append(f"[{label}]scale=-2:{rung}:flags=lanczos[o{label}]")
+    cmd = ["ffmpeg", "-y", "-loglevel", "error",
+           "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+           "-i", "-", "-filter_complex", ";".join(graph)]
+    for label, (_, path) in zip(labels, outputs):
+        cmd += ["-map", f"[o{label}]", *VP9_ARGS, str(path)]
+    return cmd
+
+
+class FrameTee:
+    """Receives manim frames and feeds them to an ffmpeg process reading raw RGBA."""
+
+    def __init__(self, command):
+        self.command = command          # (width, height, fps) -> ffmpeg argv
+        self.fps = None
+        self.proc = None
+        self.frames = 0
+
+    def write(self, frame, num_frames=1):
+        if not hasattr(frame, "shape"):          # OpenGL renderer passes itself
+            frame = frame.get_frame()
+        if self.proc is None:
+            height, width = frame.shape[:2]
+            self.proc = subprocess.Popen(self.command(width, height, self.fps),
+                                         stdin=subprocess.PIPE)
+        data = frame.tobytes()
+        for _ in range(num_frames):
+            self.proc.stdin.write(data)
+        self.frames += num_frames
+
+    def close(self):
+        if self.proc is None:
+            return
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg encode failed ({self.proc.returncode})")
+
+
+def stream_frames(job, quality, sink, **overrides):
+    """
+    Render job with manim's own encoder off and hand every frame to
+    sink.write(frame, num_frames); sink.fps is set before the first frame
+    and sink.close() runs at the end.
+    """
+    from manim import config
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    def make_wrapper(write_frame):
+        def teed_write_frame(writer, frame_or_renderer, num_frames=1):
+            if sink.fps is None:
+                sink.fps = config.frame_rate
+            sink.write(frame_or_renderer, num_frames)
+        return teed_write_frame
+
+    # manim's own encoder stays off (write_to_movie=False); caching is off so
+    # no animation is skipped because an old partial movie exists.
+    with patched(SceneFileWriter, "write_frame", make_wrapper):
+        try:
+            render_deck.render_scene(job, quality, write_to_movie=False, disable_caching=True,
+                                     **overrides)
+        finally:
+            sink.close()
+    return sink
+
+
+def render_to_ffmpeg(job, quality, command):
+    """
+    Stream job's frames into the ffmpeg process built by
+    command(width, height, fps). Returns the number of frames written.
+    """
+    return stream_frames(job, quality, FrameTee(command)).frames
+
+
+def render_ladder(job, rungs=DEFAULT_RUNGS, quality="h", out_dir=LADDER_DIR):
+    """Render job once and encode every rung. Returns {rung: path}."""
+    stem = job.target.rsplit(".", 1)[0]
+    outputs = []
+    for rung in sorted(rungs, reverse=True):
+        path = out_dir / f"{rung}p" / f"{stem}.webm"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        outputs.append((rung, path))
+
+    render_to_ffmpeg(job, quality, lambda w, h, fps: ladder_command(w, h, fps, outputs))
+    return dict(outputs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render scenes once into several resolutions.")
+    parser.add_argument("scenes", nargs="*", help="default: every scene")
+    parser.add_argument("--rungs", type=int, nargs="+", default=list(DEFAULT_RUNGS),
+                        help="output heights in pixels (default: 1080 720 480)")
+    parser.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="h",
+                        help="render quality; should be at least the top rung")
+    parser.add_argument("--assets", action="store_true",
+                        help="publish the top rung into assets/ (with chapters and poster) "
+                             "and record it in the build manifest")
+    args = parser.parse_args(argv)
+
+    jobs, _, _ = render_deck.resolve_targets(render_deck.discover_scenes())
+    jobs = render_deck.select_jobs(jobs, args.scenes)
+    manifest = render_deck.load_manifest() if args.assets else None
+    for job in jobs:
+        start = time.perf_counter()
+        with render_timeline.record_segments() as segments:
+            outputs = render_ladder(job, args.rungs, args.quality)
+        sizes = "  ".join(f"{rung}p {os.path.getsize(p) / 1024:.0f} KiB"
+                          for rung, p in outputs.items())
+        print(f"{job.scene:<20} {sizes}  ({time.perf_counter() - start:.1f}s)")
+        if args.assets:
+            key = render_deck.build_key(job, args.quality, render_deck.manim_version())
+            render_deck.publish_asset(job, outputs[max(outputs)], segments, manifest, key)
+    if args.assets and jobs:
+        render_deck.rebuild_sprite()
+    print(f"Outputs in {LADDER_DIR}/<height>p/")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
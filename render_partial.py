@@ -0,0 +1,105 @@
+"""
+Render only a window of a scene: "animations 12–15" or "seconds 8.0–11.5".
+
+Animations before the window run in manim's skip mode (state only, no
+frames); rendering stops right after the last requested animation, so only
+the window is rasterised and encoded. A seconds window is widened to the
+animations that overlap it (see render_timeline.py); the reply says where
+the requested window starts inside the clip.
+
+Output goes to media/partial/, never to assets/.
+
+Run:
+  python render_partial.py TsirelsonGauge --animations 12-15
+  python render_partial.py PRBoxCrime --seconds 20-26.5 -q m
+"""
+
+import argparse
+import shutil
+import sys
+
+import render_deck
+
+PARTIAL_DIR = render_deck.MEDIA_DIR / "partial"
+
+
+def parse_range(text, cast):
+    lo, sep, hi = text.partition("-")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected A-B, got {text!r}")
+    lo, hi = cast(lo), cast(hi)
+    if hi < lo:
+        raise argparse.ArgumentTypeError(f"empty range {text!r}")
+    return lo, hi
+
+
+def parse_animations(text):
+    lo, hi = parse_range(text, int)
+    if hi == 0:
+        raise argparse.ArgumentTypeError(
+            "a window cannot end at animation 0 (manim reads that as no limit); use 0-1")
+    return lo, hi
+
+
+def window_overrides(job, animations=None, seconds=None, quality="l"):
+    """
+    manim config overrides for a partial render.
+    Returns (overrides, (first, last), offset) where offset is the time of
+    the requested window inside the rendered clip (0 for animation ranges).
+
+    manim reads upto_animation_number=0 as "no limit", so a window ending
+    at animation 0 would render the whole scene: a seconds window is
+    widened to animation 1, an animation range is rejected.
+    """
+    offset = 0.0
+    if seconds is not None:
+        from render_timeline import animations_for_window, scene_timeline
+
+        timeline = scene_timeline(job, quality)
+        first, last = animations_for_window(timeline, *seconds)
+        offset = seconds[0] - timeline[first].start
+        last = max(last, 1)
+    elif animations is not None:
+        first, last = animations
+        if last == 0:
+            raise ValueError("an animation window cannot end at 0 (manim reads it as no limit)")
+    else:
+        raise ValueError("need an animation or a seconds window")
+    overrides = {
+        "from_animation_number": first,
+        "upto_animation_number": last,
+        "output_file": f"{job.target.rsplit('.', 1)[0]}_anim{first}-{last}",
+    }
+    return overrides, (first, last), offset
+
+
+def render_window(job, quality="l", animations=None, seconds=None, **extra):
+    overrides, (first, last), offset = window_overrides(job, animations, seconds, quality)
+    movie = render_deck.render_scene(job, quality, **overrides, **extra)
+    PARTIAL_DIR.mkdir(parents=True, exist_ok=True)
+    output = PARTIAL_DIR / f"{overrides['output_file']}{movie.suffix}"
+    shutil.copyfile(movie, output)
+    return output, (first, last), offset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a window of one scene.")
+    parser.add_argument("scene")
+    window = parser.add_mutually_exclusive_group(required=True)
+    window.add_argument("--animations", type=parse_animations,
+                        help="inclusive 0-based animation range, e.g. 12-15")
+    window.add_argument("--seconds", type=lambda t: parse_range(t, float),
+                        help="time window in seconds, e.g. 8.0-11.5")
+    parser.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="l")
+    args = parser.parse_args(argv)
+
+    jobs, _, _ = render_deck.resolve_targets(render_deck.discover_scenes())
+    job = render_deck.select_jobs(jobs, [args.scene])[0]
+    movie, (first, last), offset = render_window(job, args.quality, args.animations, args.seconds)
+    note = f"; window starts at {offset:.2f}s in the clip" if args.seconds else ""
+    print(f"{job.scene} animations {first}–{last} → {movie}{note}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
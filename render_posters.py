@@ -0,0 +1,133 @@
+"""
+Poster frames and the slide-map sprite sheet, cut from the rendered videos.
+
+For every assets/<name>.webm this writes assets/posters/<name>.webp (the
+final frame, full size, alpha kept for --transparent renders), then packs a
+thumbnail of each into assets/posters/sprite.webp with sprite.css holding
+one `.thumb-<name>` background position per scene. The deck sources do
+not reference these files; build_site.py adds `poster=` to each video and
+links sprite.css (link_posters) only for the files that exist, so a video
+slide first paints from an image instead of waiting for the decoder.
+
+render_deck.py runs this after rendering (a missing ffmpeg or Pillow
+only skips the poster); run it by hand for videos already in assets/.
+
+Run:
+  python render_posters.py                 # every video in assets/
+  python render_posters.py 2_prbox.webm    # one poster, then the sprite
+"""
+
+import argparse
+import math
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import render_deck
+
+POSTER_DIR = render_deck.ASSETS_DIR / "posters"
+THUMB_SIZE = (320, 180)
+SPRITE_COLUMNS = 4
+SCENE_BG = (15, 15, 26)          # #0f0f1a, behind transparent renders in the sprite
+SPRITE_LINK = '  <link rel="stylesheet" href="assets/posters/sprite.css" />\n'
+VIDEO_RE = re.compile(r"<video\b([^>]*)>(.*?)</video>", re.S)
+VIDEO_SRC_RE = re.compile(r'(?:data-video-)?src="assets/([^"/]+)\.webm"')
+
+
+def last_frame(video):
+    """Final frame of video as an RGBA PIL image."""
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as tmp:
+        frame = Path(tmp) / "last.png"
+        # libvpx-vp9 (not ffmpeg's native vp9) decodes the alpha plane;
+        # -update 1 keeps overwriting one image, leaving the last frame.
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-sseof", "-1",
+                        "-c:v", "libvpx-vp9", "-i", str(video),
+                        "-update", "1", "-pix_fmt", "rgba", str(frame)], check=True)
+        with Image.open(frame) as img:
+            return img.convert("RGBA")
+
+
+def write_poster(video, out_dir=POSTER_DIR):
+    video = Path(video)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    poster = out_dir / f"{video.stem}.webp"
+    last_frame(video).save(poster, "WEBP", quality=82, method=6)
+    return poster
+
+
+def build_sprite(out_dir=POSTER_DIR):
+    """Pack every poster into sprite.webp + sprite.css. Returns the scene names."""
+    from PIL import Image
+
+    posters = sorted(p for p in out_dir.glob("*.webp") if p.stem != "sprite")
+    if not posters:
+        return []
+    cols = min(SPRITE_COLUMNS, len(posters))
+    rows = math.ceil(len(posters) / cols)
+    w, h = THUMB_SIZE
+    sheet = Image.new("RGB", (cols * w, rows * h), SCENE_BG)
+    css = [
+        "/* Generated by render_posters.py; do not edit. */",
+        ".map-card.has-thumb {",
+        "  background-image: linear-gradient(rgba(15, 15, 26, 0.45), rgba(15, 15, 26, 0.85)),"
+        " url(sprite.webp);",
+        f"  background-size: 100% 100%, {cols * 100}% {rows * 100}%;",
+        "}",
+        # light text on the darkened thumbnail, in either deck theme
+        ".map-card.has-thumb .map-num,",
+        ".map-card.has-thumb .map-title,",
+        ".map-card.has-thumb .map-section { color: #f0f2f8; text-shadow: 0 1px 3px rgba(0, 0, 0, 0.8); }",
+    ]
+    for i, poster in enumerate(posters):
+        col, row = i % cols, i // cols
+        with Image.open(poster) as img:
+            thumb = Image.new("RGB", img.size, SCENE_BG)
+            thumb.paste(img, mask=img.convert("RGBA").getchannel("A"))
+        sheet.paste(thumb.resize(THUMB_SIZE, Image.LANCZOS), (col * w, row * h))
+        x = col / (cols - 1) * 100 if cols > 1 else 0
+        y = row / (rows - 1) * 100 if rows > 1 else 0
+        css.append(f".map-card.thumb-{poster.stem} {{ background-position: 0 0, {x:g}% {y:g}%; }}")
+    sheet.save(out_dir / "sprite.webp", "WEBP", quality=80, method=6)
+    (out_dir / "sprite.css").write_text("\n".join(css) + "\n", encoding="utf-8")
+    return [p.stem for p in posters]
+
+
+def link_posters(html, out_dir=POSTER_DIR):
+    """
+    html with poster= on every <video> whose poster exists and, if the
+    page has a slide map and the sprite was built, sprite.css linked at
+    the end of <head>.
+    """
+    def add_poster(m):
+        attrs, body = m.groups()
+        src = VIDEO_SRC_RE.search(body)
+        if "poster=" in attrs or not src or not (out_dir / f"{src.group(1)}.webp").exists():
+            return m.group()
+        return f'<video{attrs} poster="assets/posters/{src.group(1)}.webp">{body}</video>'
+
+    html = VIDEO_RE.sub(add_poster, html)
+    if "has-thumb" in html and (out_dir / "sprite.css").exists():
+        html = html.replace("</head>", SPRITE_LINK + "</head>", 1)
+    return html
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cut posters and the slide-map sprite sheet.")
+    parser.add_argument("videos", nargs="*", help="asset file names (default: assets/*.webm)")
+    args = parser.parse_args(argv)
+
+    videos = ([render_deck.ASSETS_DIR / v for v in args.videos] if args.videos
+              else sorted(render_deck.ASSETS_DIR.glob("*.webm")))
+    for video in videos:
+        print(f"{video.name} → {write_poster(video).relative_to(render_deck.ROOT)}")
+    names = build_sprite()
+    print(f"sprite: {len(names)} thumbnails → {(POSTER_DIR / 'sprite.webp').relative_to(render_deck.ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Per-animation profile of a scene render.
+
+For every self.play / self.wait the report records wall time, frames
+written, the number of family mobjects on screen, and how the time split
+between typesetting (TeX + Pango), Cairo rasterisation and video encoding,
+plus resident memory at its end and how much it grew (rss_mb,
+rss_delta_mb; Linux only). The report's peak_rss_mb is the peak of the
+whole process. The time between two calls is reported as a "construct"
+segment (Python-side mobject building, usually dominated by typesetting),
+and the final movie assembly as "finalize".
+
+Output: media/profile/<Scene>.json and <Scene>.folded (flamegraph.pl /
+speedscope input), plus a summary table on stdout. Caching of partial
+movies is disabled so every animation is really rendered.
+
+Run:
+  python render_profile.py ICGame DPIChain -q l
+  python render_deck.py --profile -q l          # profile a whole build
+"""
+
+import argparse
+import json
+import resource
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+
+import render_deck
+from render_hooks import observe_plays, patched
+
+PROFILE_DIR = render_deck.MEDIA_DIR / "profile"
+PHASES = ("typeset", "render", "encode")
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024   # KiB on Linux
+
+
+def _rss_mb():
+    """Current resident set size, or None without /proc."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return pages * resource.getpagesize() / 2**20
+
+
+def _family_size(scene):
+    return sum(len(m.get_family()) for m in scene.mobjects)
+
+
+class Profiler:
+    """Accumulates phase timings into the currently open segment."""
+
+    def __init__(self):
+        self.segments = []
+        self._open = None
+        self._start = None
+        self._rss_start = None
+        self._active_phase = None
+
+    # ── segments ──
+    def open(self, kind, label="", line=0, index=None):
+        self.close()
+        self._start = time.perf_counter()
+        self._rss_start = _rss_mb()
+        self._open = {"index": index, "kind": kind, "label": label, "line": line,
+                      "frames": 0, **{p: 0.0 for p in PHASES}}
+
+    def close(self, scene=None, kind=None):
+        if self._open is None:
+            return
+        if kind:
+            self._open["kind"] = kind
+        seg = self._open
+        seg["wall"] = time.perf_counter() - self._start
+        seg["python"] = max(0.0, seg["wall"] - sum(seg[p] for p in PHASES))
+        rss = _rss_mb()
+        if rss is not None:
+            seg["rss_mb"] = round(rss, 1)
+            seg["rss_delta_mb"] = round(rss - self._rss_start, 1)
+        if scene is not None:
+            seg["family_mobjects"] = _family_size(scene)
+        self.segments.append(seg)
+        self._open = None
+
+    # ── phase timers ──
+    def timed(self, phase, count_frames=False):
+        def make_wrapper(fn):
+            def wrapper(*args, **kwargs):
+                if self._active_phase is not None or self._open is None:
+                    return fn(*args, **kwargs)   # nested: attribute to the outer phase
+                self._active_phase = phase
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._open[phase] += time.perf_counter() - start
+                    if count_frames:
+                        self._open["frames"] += kwargs.get("num_frames", args[2] if len(args) > 2 else 1)
+                    self._active_phase = None
+            return wrapper
+        return make_wrapper
+
+    @contextmanager
+    def instrument(self):
+        import manim.mobject.text.tex_mobject as tex_mobject
+        import manim.mobject.text.text_mobject as text_mobject
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        def on_start(scene, call):
+            self.close(scene)
+            self.open(call.kind, call.label, call.line, call.index)
+
+        def on_end(scene, call):
+            self.close(scene)
+            self.open("construct")
+
+        with ExitStack() as stack:
+            stack.enter_context(patched(tex_mobject, "tex_to_svg_file", self.timed("typeset")))
+            stack.enter_context(patched(text_mobject.Text, "_text2svg", self.timed("typeset")))
+            stack.enter_context(patched(text_mobject.MarkupText, "_text2svg", self.timed("typeset")))
+            stack.enter_context(patched(CairoRenderer, "update_frame", self.timed("render")))
+            stack.enter_context(patched(SceneFileWriter, "write_frame",
+                                        self.timed("encode", count_frames=True)))
+            stack.enter_context(patched(SceneFileWriter, "combine_to_movie", self.timed("encode")))
+            stack.enter_context(observe_plays(on_start, on_end))
+            self.open("construct")
+            yield self
+
+    def report(self, job, quality):
+        totals = {k: round(sum(s[k] for s in self.segments), 4)
+                  for k in ("wall", "python", "frames", *PHASES)}
+        return {
+            "scene": f"{job.module}.{job.scene}",
+            "quality": quality,
+            "manim": render_deck.manim_version(),
+            "peak_rss_mb": round(_peak_rss_mb(), 1),
+            "totals": totals,
+            "segments": self.segments,
+        }
+
+
+def profile_scene(job, quality="l", out_dir=PROFILE_DIR, **overrides):
+    """Render job with instrumentation and write its JSON + folded reports."""
+    profiler = Profiler()
+    with profiler.instrument():
+        movie = render_deck.render_scene(job, quality, disable_caching=True, **overrides)
+        # whatever ran after the last play (tear-down, combine_to_movie)
+        profiler.close(kind="finalize")
+    report = profiler.report(job, quality)
+    report["movie"] = str(movie)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / f"{job.scene}.json").write_text(json.dumps(report, indent=2) + "\n",
+                                               encoding="utf-8")
+    (out_dir / f"{job.scene}.folded").write_text(folded_stacks(report), encoding="utf-8")
+    return report
+
+
+def folded_stacks(report):
+    """Brendan Gregg's folded format, weights in microseconds."""
+    lines = []
+    for seg in report["segments"]:
+        name = seg["kind"] if seg["index"] is None else \
+            f"{seg['kind']}#{seg['index']} {seg['label']} (line {seg['line']})"
+        for phase in ("python", *PHASES):
+            weight = int(seg[phase] * 1e6)
+            if weight:
+                lines.append(f"{report['scene']};{name};{phase} {weight}")
+    return "\n".join(lines) + "\n"
+
+
+def print_summary(report, top=10):
+    t = report["totals"]
+    print(f"\n{report['scene']}  -q{report['quality']}  {t['wall']:.2f}s  "
+          f"{int(t['frames'])} frames  peak {report['peak_rss_mb']:.0f} MB")
+    for phase in ("python", *PHASES):
+        share = t[phase] / t["wall"] if t["wall"] else 0.0
+        print(f"  {phase:<8} {t[phase]:7.2f}s  {'█' * round(share * 40):<40} {share:5.1%}")
+    print(f"  slowest {top} segments:")
+    for seg in sorted(report["segments"], key=lambda s: -s["wall"])[:top]:
+        where = f"line {seg['line']}" if seg["line"] else ""
+        dominant = max(("python", *PHASES), key=lambda p: seg[p])
+        print(f"    {seg['wall']:6.2f}s  {seg['kind']:<9} {where:<9} {seg['label'][:34]:<34} "
+              f"{seg['frames']:>4}f  mostly {dominant}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile scene renders per animation.")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="l")
+    args = parser.parse_args(argv)
+
+    jobs = render_deck.select_jobs(render_deck.discover_scenes(), args.scenes)
+    for job in jobs:
+        print_summary(profile_scene(job, args.quality))
+    print(f"\nReports in {PROFILE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Frame-parallel rendering of a single long scene (DPIChain, ICGame, ...).
+
+The scene's timeline is cut at animation boundaries into chunks of similar
+rendering cost. Each chunk is rendered in its own process as a partial
+render (earlier animations replayed in skip mode, so state is rebuilt
+without drawing frames), and the partial webm files are joined with
+ffmpeg's concat demuxer without re-encoding.
+
+Run:
+  python render_split.py DPIChain -j 8
+  python render_split.py ICGame -q h --assets     # also publish into assets/ + manifest
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import render_deck
+import render_partial
+
+# A static wait is a single frozen frame written N times: almost free.
+STATIC_WEIGHT = 0.05
+
+
+def plan_chunks(segments, n_chunks):
+    """Split segments into ≤ n_chunks contiguous (first, last) animation ranges of similar cost."""
+    if not segments:
+        return []
+    weights = [s.duration * (STATIC_WEIGHT if s.static else 1.0) for s in segments]
+    total = sum(weights) or 1.0
+    # No chunk ends at animation 0: manim reads upto_animation_number=0 as
+    # "no limit", so a (0, 0) chunk would render the whole scene. Animation 0
+    # always shares the first chunk with animation 1.
+    n_chunks = max(1, min(n_chunks, len(segments) - 1))
+    chunks = []
+    first = 0
+    acc = 0.0
+    for i, w in enumerate(weights):
+        acc += w
+        remaining_segments = len(segments) - i - 1
+        remaining_chunks = n_chunks - len(chunks) - 1
+        if i and remaining_chunks and (acc >= total * (len(chunks) + 1) / n_chunks
+                                       or remaining_segments == remaining_chunks):
+            chunks.append((segments[first].index, segments[i].index))
+            first = i + 1
+    chunks.append((segments[first].index, segments[-1].index))
+    return chunks
+
+
+def _render_chunk(job, quality, first, last):
+    # Own media dir per chunk: manim writes a shared partial_movie_file_list.txt
+    # per scene, which concurrent chunks of the same scene would overwrite.
+    media_dir = render_deck.MEDIA_DIR / "split" / job.scene / f"{first}-{last}"
+    movie, _, _ = render_partial.render_window(job, quality, animations=(first, last),
+                                               media_dir=str(media_dir))
+    return str(movie)
+
+
+def stitch(parts, output):
+    """Concatenate same-codec webm files without re-encoding."""
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for part in parts:
+            listing.write(f"file '{Path(part).resolve().as_posix()}'\n")
+    tmp = output.with_suffix(".part" + output.suffix)
+    try:
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing.name, "-c", "copy", str(tmp)], check=True)
+        os.replace(tmp, output)
+    finally:
+        os.unlink(listing.name)
+    return output
+
+
+def render_frame_parallel(job, quality="h", workers=None):
+    """Render job in parallel chunks; returns (stitched movie path, chunks)."""
+    from render_timeline import scene_timeline
+
+    workers = workers or os.cpu_count() or 1
+    chunks = plan_chunks(scene_timeline(job, quality), workers)
+    if len(chunks) == 1:          # nothing to split (and a 0–0 window cannot be expressed)
+        return render_deck.render_scene(job, quality), chunks
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [pool.submit(_render_chunk, job, quality, a, b) for a, b in chunks]
+        parts = [f.result() for f in futures]
+    output = render_partial.PARTIAL_DIR / f"{job.target.rsplit('.', 1)[0]}_split.webm"
+    return stitch(parts, output), chunks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one scene on several cores.")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--assets", action="store_true",
+                        help="publish the result into assets/ (with chapters and poster) "
+                             "and record it in the build manifest")
+    args = parser.parse_args(argv)
+
+    jobs, _, _ = render_deck.resolve_targets(render_deck.discover_scenes())
+    job = render_deck.select_jobs(jobs, [args.scene])[0]
+    start = time.perf_counter()
+    movie, chunks = render_frame_parallel(job, args.quality, args.jobs)
+    ranges = ", ".join(f"{a}–{b}" for a, b in chunks)
+    print(f"{job.scene}: {len(chunks)} chunk(s) [{ranges}] → {movie} "
+          f"({time.perf_counter() - start:.1f}s)")
+
+    if args.assets:
+        key = render_deck.build_key(job, args.quality, render_deck.manim_version())
+        render_deck.publish_asset(job, movie, manifest=render_deck.load_manifest(), key=key)
+        render_deck.rebuild_sprite()
+        print(f"  → assets/{job.target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
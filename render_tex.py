@@ -0,0 +1,339 @@
+"""
+Batched LaTeX pre-pass for the deck.
+
+Every distinct MathTex/Tex string normally costs its own latex + dvisvgm
+run on a cold cache. This pre-pass collects the literal TeX strings used in
+the scene modules, lets manim tell us the exact .tex source it would
+compile for each, and compiles all of them as pages of one multi-page
+standalone document. The pages are split into the per-string SVG files that
+manim looks up in its tex_dir, so the scenes find them already typeset.
+
+String literals are collected, and so are f-strings whose fields only use
+module-level constants (literal assignments, or numbers and strings
+imported from repo modules such as bell_chsh.TSIRELSON_BOUND). Calls built
+from loop variables or other run-time values are still typeset by manim
+on demand; the pre-pass reports how many, and --dry-run lists them.
+font_size and color do not change the SVG, so each string is compiled
+once regardless of size.
+
+Run:
+  python render_tex.py                # pre-compile into media/Tex and the SVG cache
+  python render_tex.py --dry-run      # list the collected strings
+"""
+
+import argparse
+import ast
+import importlib
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+TEX_CLASSES = {"MathTex", "Tex"}
+
+# Keyword arguments that change the compiled TeX. String-valued ones are
+# collected with the call; calls using any other one are left to manim.
+TEX_STR_KWARGS = {"tex_environment", "arg_separator"}
+TEX_OTHER_KWARGS = {"substrings_to_isolate", "tex_to_color_map", "tex_template"}
+
+# What an f-string field may contain to be evaluated ahead of the render.
+STATIC_NODES = (ast.JoinedStr, ast.FormattedValue, ast.Constant, ast.Name, ast.Load,
+                ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop)
+
+DOCCLASS_RE = re.compile(r"\\documentclass(\[[^\]]*\])?\{standalone\}")
+
+
+@dataclass(frozen=True)
+class TexCall:
+    cls: str          # "MathTex" or "Tex"
+    args: tuple       # positional TeX strings
+    kwargs: tuple     # literal TeX-affecting keyword arguments, sorted
+
+
+# ─────────────────────────────────────────────────────────
+# Static collection
+# ─────────────────────────────────────────────────────────
+def module_constants(tree, root=ROOT):
+    """
+    Module-level names whose value is known without running a scene:
+    literal assignments, and numbers/strings imported from repo modules.
+    """
+    constants = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)):
+            try:
+                value = ast.literal_eval(node.value)
+            except (ValueError, TypeError, SyntaxError):
+                continue
+            if isinstance(value, (int, float, str)):
+                constants[node.targets[0].id] = value
+        elif (isinstance(node, ast.ImportFrom) and node.module and not node.level
+              and (root / f"{node.module}.py").exists()):
+            module = importlib.import_module(node.module)
+            for alias in node.names:
+                value = getattr(module, alias.name, None)
+                if isinstance(value, (int, float, str)):
+                    constants[alias.asname or alias.name] = value
+    return constants
+
+
+def static_string(node, constants):
+    """Value of a str literal, or of an f-string over constants; None otherwise."""
+    if isinstance(node, ast.Constant):
+        return node.value if isinstance(node.value, str) else None
+    if not isinstance(node, ast.JoinedStr):
+        return None
+    for sub in ast.walk(node):
+        if not isinstance(sub, STATIC_NODES) or (isinstance(sub, ast.Name)
+                                                 and sub.id not in constants):
+            return None
+    try:
+        return eval(compile(ast.Expression(node), "<tex>", "eval"),
+                    {"__builtins__": {}}, dict(constants))
+    except Exception:            # e.g. a format spec that does not fit the value
+        return None
+
+
+def collect_tex_calls(modules, root=ROOT, skipped=None):
+    """
+    Return the set of MathTex/Tex calls in the given modules whose TeX is
+    known statically. Calls left to manim are appended to skipped as
+    "module.py:line" when a list is given.
+    """
+    calls = set()
+    for module in modules:
+        source = (root / f"{module}.py").read_text(encoding="utf-8")
+        tree = ast.parse(source)
+        constants = module_constants(tree, root)
+        tex_calls = [n for n in ast.walk(tree) if isinstance(n, ast.Call)
+                     and isinstance(n.func, ast.Name) and n.func.id in TEX_CLASSES]
+        for node in sorted(tex_calls, key=lambda n: (n.lineno, n.col_offset)):
+            args = [static_string(a, constants) for a in node.args]
+            kwargs = []
+            known = bool(args) and None not in args
+            for kw in node.keywords:
+                if kw.arg in TEX_OTHER_KWARGS or kw.arg is None:
+                    known = False
+                elif kw.arg in TEX_STR_KWARGS:
+                    value = static_string(kw.value, constants)
+                    if value is None:
+                        known = False
+                    else:
+                        kwargs.append((kw.arg, value))
+            if known:
+                calls.add(TexCall(node.func.id, tuple(args), tuple(sorted(kwargs))))
+            elif skipped is not None:
+                skipped.append(f"{module}.py:{node.lineno}")
+    return calls
+
+
+# ─────────────────────────────────────────────────────────
+# Resolve calls to the exact .tex manim would compile
+# ─────────────────────────────────────────────────────────
+class _Captured(Exception):
+    pass
+
+
+def resolve_expressions(calls):
+    """
+    Instantiate each call with manim's tex_to_svg_file intercepted, so the
+    expression/environment/template are exactly what a render would use.
+    Returns [(expression, environment, tex_template)] without duplicates.
+    """
+    import manim.mobject.text.tex_mobject as tex_mobject
+
+    def capture(expression, environment=None, tex_template=None):
+        raise _Captured(expression, environment, tex_template)
+
+    resolved = {}
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = capture
+    try:
+        for call in sorted(calls, key=repr):
+            cls = getattr(tex_mobject, call.cls)
+            try:
+                cls(*call.args, **dict(call.kwargs))
+            except _Captured as hit:
+                expression, environment, template = hit.args
+                resolved.setdefault((expression, environment, id(template)),
+                                    (expression, environment, template))
+            except Exception as exc:
+                print(f"  ! skipped {call.cls}{call.args!r}: {exc}", file=sys.stderr)
+    finally:
+        tex_mobject.tex_to_svg_file = original
+    return list(resolved.values())
+
+
+# ─────────────────────────────────────────────────────────
+# Batch compile
+# ─────────────────────────────────────────────────────────
+def _split_document(texcode):
+    head, rest = texcode.split(r"\begin{document}", 1)
+    body, _ = rest.rsplit(r"\end{document}", 1)
+    return head, body
+
+
+def _multi_preamble(head):
+    """Turn the standalone preamble into a multi-page one (one page per item)."""
+    def add_multi(match):
+        options = (match.group(1) or "[]")[1:-1]
+        options = ",".join(o for o in (options, "multi") if o)
+        return rf"\documentclass[{options}]{{standalone}}"
+
+    new_head, n = DOCCLASS_RE.subn(add_multi, head, count=1)
+    return new_head if n else None
+
+
+def _compile(head, items, workdir, tex_template):
+    """
+    Compile items [(body, svg_path)] as one document, moving page k to the
+    k-th svg_path. Returns True when every page was written.
+    """
+    doc = [head, r"\begin{document}"]
+    for body, _ in items:
+        doc += [r"\begin{standalone}", body.strip(), r"\end{standalone}"]
+    doc.append(r"\end{document}")
+
+    tex_file = workdir / "batch.tex"
+    tex_file.write_text("\n".join(doc) + "\n", encoding="utf-8")
+    dvi_file = tex_file.with_suffix(tex_template.output_format)
+    dvi_file.unlink(missing_ok=True)
+    for stale in workdir.glob("page-*.svg"):
+        stale.unlink()
+    compiled = subprocess.run(
+        [tex_template.tex_compiler, "-interaction=batchmode", "-halt-on-error",
+         f"-output-directory={workdir}", str(tex_file)],
+        cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    ).returncode == 0 and dvi_file.exists()
+    if not compiled:
+        return False
+    converted = subprocess.run(
+        ["dvisvgm", *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+         "-n", "-v", "0", "-p", "1-", "-o", str(workdir / "page-%p.svg"), str(dvi_file)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    ).returncode == 0
+    pages = sorted(workdir.glob("page-*.svg"), key=lambda p: int(p.stem.split("-")[1]))
+    if not converted or len(pages) != len(items):
+        return False
+    for page, (_, svg_path) in zip(pages, items):
+        shutil.move(str(page), svg_path)
+    return True
+
+
+def _bisect(head, items, workdir, tex_template):
+    """Compile items, halving on failure so one bad string costs log2(n) retries."""
+    if not items:
+        return 0
+    if _compile(head, items, workdir, tex_template):
+        return len(items)
+    if len(items) == 1:
+        print(f"  ! could not batch-compile {items[0][1].name}; manim will retry it",
+              file=sys.stderr)
+        return 0
+    mid = len(items) // 2
+    return (_bisect(head, items[:mid], workdir, tex_template)
+            + _bisect(head, items[mid:], workdir, tex_template))
+
+
+def _compile_batch(head, items, workdir, tex_template):
+    """
+    Compile items [(body, svg_path)] as one document. When that fails, one
+    string is compiled alone: if it fails too the preamble or toolchain is
+    at fault, so the whole batch is left to manim rather than bisected into
+    2n - 1 failing runs; otherwise the rest is bisected to isolate the bad
+    string. Returns the number of SVGs written.
+    """
+    if not items:
+        return 0
+    if _compile(head, items, workdir, tex_template):
+        return len(items)
+    if not _compile(head, items[:1], workdir, tex_template):
+        print(f"  ! TeX batch failed, {items[0][1].name} alone too; "
+              f"manim will compile these {len(items)} string(s)", file=sys.stderr)
+        return 0
+    return 1 + _bisect(head, items[1:], workdir, tex_template)
+
+
+def precompile(expressions, cache=None):
+    """
+    Compile every expression whose SVG is neither in tex_dir nor in the
+    shared SVG cache, publishing new SVGs to the cache.
+    Returns (compiled, already_cached).
+    """
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    from render_cache import tex_key
+
+    groups = {}
+    cached = 0
+    for expression, environment, template in expressions:
+        tex_file = generate_tex_file(expression, environment, template)
+        svg_path = tex_file.with_suffix(".svg")
+        if svg_path.exists() or (cache and cache.fetch(tex_key(tex_file), svg_path)):
+            cached += 1
+            continue
+        texcode = template.get_texcode_for_expression_in_env(expression, environment)
+        head, body = _split_document(texcode)
+        groups.setdefault((head, template.tex_compiler, template.output_format),
+                          (template, []))[1].append((body, svg_path))
+
+    compiled = 0
+    for (head, _, _), (template, items) in groups.items():
+        multi_head = _multi_preamble(head)
+        if multi_head is None:
+            continue  # not a standalone template — leave these to manim
+        with tempfile.TemporaryDirectory(prefix="texbatch-") as tmp:
+            compiled += _compile_batch(multi_head, items, Path(tmp), template)
+        if cache:
+            for _, svg_path in items:
+                if svg_path.exists():
+                    cache.store(tex_key(svg_path), svg_path)
+    return compiled, cached
+
+
+def prepass(modules, tex_dir, cache=None):
+    """Collect, resolve and batch-compile the deck's TeX into tex_dir (and the cache)."""
+    from manim import tempconfig
+
+    skipped = []
+    calls = collect_tex_calls(modules, skipped=skipped)
+    with tempconfig({"tex_dir": str(tex_dir), "verbosity": "WARNING"}):
+        Path(tex_dir).mkdir(parents=True, exist_ok=True)
+        expressions = resolve_expressions(calls)
+        compiled, cached = precompile(expressions, cache)
+    if cache:
+        cache.flush_stats()
+    print(f"TeX pre-pass: {len(expressions)} strings, "
+          f"{compiled} compiled in batch, {cached} already cached; "
+          f"{len(skipped)} call(s) with run-time arguments left to manim")
+    return compiled, cached
+
+
+def main(argv=None):
+    from render_deck import MEDIA_DIR, SCENE_MODULES
+
+    parser = argparse.ArgumentParser(description="Batch-compile the deck's TeX strings.")
+    parser.add_argument("--tex-dir", type=Path, default=MEDIA_DIR / "Tex")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="only list the collected strings")
+    args = parser.parse_args(argv)
+
+    if args.dry_run:
+        skipped = []
+        for call in sorted(collect_tex_calls(SCENE_MODULES, skipped=skipped), key=repr):
+            print(f"{call.cls:<8} {' | '.join(call.args)}")
+        print(f"left to manim (run-time arguments): {', '.join(skipped) or 'none'}")
+        return 0
+    from render_cache import SvgCache
+
+    prepass(SCENE_MODULES, args.tex_dir, SvgCache())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
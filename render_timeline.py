@@ -0,0 +1,162 @@
+"""
+Timeline of a scene: start/end time of every self.play / self.wait.
+
+The timeline comes from a dry pass of construct() with animations skipped
+(state only, no frames, no movie), so it costs about as much as building
+the mobjects. Animation indices are 0-based and match manim's -n option.
+
+The same segments are written as WebVTT chapters next to each webm
+(assets/<name>.vtt, one cue per animation), which the deck uses to pause
+on holds. render_deck.py records them during the real render; --vtt
+exports them from a dry pass for videos that are already rendered. The
+deck sources carry no <track>: build_site.py adds one next to each
+video's <source> (link_chapters) only when its .vtt exists.
+
+Run:
+  python render_timeline.py TsirelsonGauge
+  python render_timeline.py ProofSketch PRBoxCrime --vtt
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import render_deck
+from render_hooks import observe_plays
+from render_posters import VIDEO_RE
+
+SOURCE_RE = re.compile(r'([ \t]*)<source\b[^>]*?\b((?:data-video-)?src)="assets/([^"/]+)\.webm"[^>]*>')
+
+
+@dataclass
+class Segment:
+    index: int
+    kind: str       # "play" or "wait"
+    label: str
+    line: int
+    start: float    # seconds from the beginning of the video
+    end: float
+    static: bool    # frozen frame: nothing moves (a wait without updaters)
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+@contextmanager
+def record_segments():
+    """Collect a Segment for every animation played inside the block."""
+    segments = []
+    clock = [0.0]
+
+    def on_end(scene, call):
+        duration = float(getattr(scene, "duration", 0.0) or 0.0)
+        try:
+            static = bool(scene.is_current_animation_frozen_frame())
+        except (AttributeError, IndexError):
+            static = False
+        segments.append(Segment(call.index, call.kind, call.label, call.line,
+                                clock[0], clock[0] + duration, static))
+        clock[0] += duration
+
+    with observe_plays(on_end=on_end):
+        yield segments
+
+
+def scene_timeline(job, quality="l"):
+    """Dry-run job and return its list of Segments."""
+    with record_segments() as segments:
+        render_deck.render_scene(job, quality, skip_animations=True, write_to_movie=False,
+                                 save_last_frame=False, disable_caching=True)
+    return segments
+
+
+def animations_for_window(segments, t0, t1):
+    """(first, last) animation indices whose segments overlap [t0, t1)."""
+    hits = [s.index for s in segments if s.end > t0 and s.start < t1]
+    if not hits:
+        end = segments[-1].end if segments else 0.0
+        raise ValueError(f"window {t0:g}–{t1:g}s is outside the scene (0–{end:g}s)")
+    return hits[0], hits[-1]
+
+
+def _vtt_time(seconds):
+    ms = round(seconds * 1000)
+    return f"{ms // 3_600_000:02d}:{ms // 60_000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+
+
+def webvtt(segments):
+    """WebVTT chapters: cue id "<kind>-<index>", text = animation label."""
+    lines = ["WEBVTT", ""]
+    for s in segments:
+        if s.duration <= 0:
+            continue
+        lines += [f"{s.kind}-{s.index}", f"{_vtt_time(s.start)} --> {_vtt_time(s.end)}",
+                  s.label, ""]
+    return "\n".join(lines)
+
+
+def write_chapters(segments, path):
+    path = Path(path)
+    tmp = path.with_suffix(".vtt.part")
+    tmp.write_text(webvtt(segments), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def chapters_path(job, assets_dir=render_deck.ASSETS_DIR):
+    return Path(assets_dir) / (job.target.rsplit(".", 1)[0] + ".vtt")
+
+
+def link_chapters(html, assets_dir=render_deck.ASSETS_DIR):
+    """
+    html with a chapters <track> after the <source> of every <video> whose
+    assets/<name>.vtt exists, using the same src / data-video-src attribute
+    as the source so lazy-loaded videos fetch it together.
+    """
+    def add_track(m):
+        attrs, body = m.groups()
+        src = SOURCE_RE.search(body)
+        if "<track" in body or not src or not (Path(assets_dir) / f"{src.group(3)}.vtt").exists():
+            return m.group()
+        indent, attr, name = src.groups()
+        track = f'\n{indent}<track kind="chapters" srclang="en" {attr}="assets/{name}.vtt" />'
+        return f"<video{attrs}>{body[:src.end()]}{track}{body[src.end():]}</video>"
+
+    return VIDEO_RE.sub(add_track, html)
+
+
+def print_timeline(segments):
+    for s in segments:
+        flag = "  static" if s.static else ""
+        where = f"line {s.line}" if s.line else ""
+        print(f"#{s.index:<3} {s.start:7.2f}–{s.end:7.2f}s  {s.kind:<5} {where:<9} {s.label}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the animation timeline of scenes.")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--vtt", action="store_true",
+                        help="write assets/<name>.vtt chapters instead of printing")
+    args = parser.parse_args(argv)
+
+    for job in render_deck.select_jobs(render_deck.discover_scenes(), args.scenes):
+        segments = scene_timeline(job)
+        if args.vtt:
+            print(f"{job.scene} → {write_chapters(segments, chapters_path(job))}")
+        elif args.json:
+            print(json.dumps({"scene": job.scene, "segments": [asdict(s) for s in segments]}))
+        else:
+            print(f"{job.scene}  ({segments[-1].end if segments else 0:.2f}s)")
+            print_timeline(segments)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Variable-frame-rate output: a hold is one frame with a long duration.
+
+manim already rasterises a frozen self.wait only once, but then writes the
+same frame 60 times a second and the encoder compresses every copy. Here
+frames go straight from manim to a PyAV VP9 encoder with explicit
+timestamps: a frame passed with num_frames > 1, or identical to the frame
+before it, extends the current frame's display time instead of being
+encoded again. WebM carries the timestamps, so the player holds the frame.
+
+render_deck.py --vfr renders the deck this way.
+
+Run:
+  python render_vfr.py BoxWorldBreaks BigPicture      # → media/vfr/, with frame counts
+"""
+
+import argparse
+import sys
+import time
+from fractions import Fraction
+
+import render_deck
+from render_ladder import stream_frames
+
+VFR_DIR = render_deck.MEDIA_DIR / "vfr"
+VP9_OPTIONS = {"crf": "32", "b": "0", "row-mt": "1", "deadline": "good", "cpu-used": "2"}
+
+
+class HoldWriter:
+    """Encodes manim frames with PyAV, turning repeated frames into one held frame."""
+
+    def __init__(self, path, transparent=False):
+        self.path = path
+        self.transparent = transparent
+        self.fps = None
+        self.container = None
+        self.stream = None
+        self.last = None          # last encoded frame (a copy: manim reuses its buffer)
+        self.last_pts = -1
+        self.pts = 0              # frame index the next frame starts at
+        self.encoded = 0
+
+    def _open(self, frame):
+        import av
+
+        height, width = frame.shape[:2]
+        self.container = av.open(str(self.path), mode="w")
+        self.stream = self.container.add_stream("libvpx-vp9", rate=Fraction(self.fps).limit_denominator())
+        self.stream.width, self.stream.height = width, height
+        self.stream.pix_fmt = "yuva420p" if self.transparent else "yuv420p"
+        self.stream.options = dict(VP9_OPTIONS)
+
+    def _encode(self, frame, pts):
+        import av
+
+        video_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        video_frame.pts = pts
+        for packet in self.stream.encode(video_frame):
+            self.container.mux(packet)
+        self.last_pts = pts
+        self.encoded += 1
+
+    def write(self, frame, num_frames=1):
+        import numpy as np
+
+        if not hasattr(frame, "shape"):          # OpenGL renderer passes itself
+            frame = frame.get_frame()
+        if self.container is None:
+            self._open(frame)
+        if self.last is None or not np.array_equal(frame, self.last):
+            self._encode(frame, self.pts)
+            self.last = frame.copy()
+        self.pts += num_frames
+
+    @property
+    def frames(self):
+        """Frames a constant-rate encode would have written."""
+        return self.pts
+
+    def close(self):
+        if self.container is None:
+            return
+        # re-send the held frame at the end so the stream lasts the full hold
+        if self.last is not None and self.pts - 1 > self.last_pts:
+            self._encode(self.last, self.pts - 1)
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+def render_vfr(job, quality="h", out_dir=VFR_DIR, transparent=False):
+    """Render job as VFR webm into out_dir; returns (path, writer)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / job.target
+    writer = HoldWriter(path, transparent)
+    overrides = {"transparent": True} if transparent else {}
+    stream_frames(job, quality, writer, **overrides)
+    return path, writer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render scenes with held frames (VFR).")
+    parser.add_argument("scenes", nargs="+")
+    parser.add_argument("-q", "--quality", choices=sorted(render_deck.QUALITIES), default="h")
+    args = parser.parse_args(argv)
+
+    jobs, _, _ = render_deck.resolve_targets(render_deck.discover_scenes())
+    for job in render_deck.select_jobs(jobs, args.scenes):
+        start = time.perf_counter()
+        path, writer = render_vfr(job, args.quality)
+        print(f"{job.scene:<20} {writer.encoded}/{writer.frames} frames encoded, "
+              f"{path.stat().st_size / 1024:.0f} KiB  ({time.perf_counter() - start:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())